@@ -0,0 +1,94 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+"""
+Compiled histogram core for the MetricsCollector record hot path.
+
+Optional accelerator: build in place with
+
+    cythonize -i whisperlivekit/performance/_metrics_core.pyx
+
+logging_metrics.py falls back to the pure-Python _BucketHistogram when
+the compiled module is unavailable. The layout must stay in sync with
+the Python implementation: 32 sub-buckets per power of two, 1408
+buckets.
+"""
+
+from libc.math cimport log2, INFINITY
+from libc.string cimport memset
+
+DEF SUB_BUCKETS = 32
+DEF MAX_BUCKETS = 1408
+
+
+cdef class BucketHistogram:
+    """HDR-style log-bucket histogram backed by a C count array.
+
+    Recording touches only C fields, so the per-sample cost is a couple
+    of C instructions; the bucket update itself runs without the GIL.
+    """
+
+    cdef unsigned long long _counts[MAX_BUCKETS]
+    cdef public long long count
+    cdef public double total
+    cdef public double min
+    cdef public double max
+
+    def __cinit__(self):
+        memset(self._counts, 0, sizeof(self._counts))
+        self.count = 0
+        self.total = 0.0
+        self.min = INFINITY
+        self.max = -INFINITY
+
+    @property
+    def counts(self):
+        return [self._counts[i] for i in range(MAX_BUCKETS)]
+
+    cpdef record(self, double value):
+        """Record one sample."""
+        cdef int bucket = 0
+        if value > 0:
+            bucket = <int>(log2(value + 1.0) * SUB_BUCKETS)
+            if bucket >= MAX_BUCKETS:
+                bucket = MAX_BUCKETS - 1
+        with nogil:
+            self._counts[bucket] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def record_many(self, values):
+        """Record a batch of samples."""
+        for value in values:
+            self.record(value)
+
+    def percentiles(self, fractions):
+        """Values at the given ascending fractions, in one cumulative sweep."""
+        cdef list thresholds = [f * self.count for f in fractions]
+        cdef list results = []
+        cdef Py_ssize_t idx = 0
+        cdef Py_ssize_t n = len(thresholds)
+        cdef unsigned long long cumulative = 0
+        cdef int bucket
+        cdef double upper
+        for bucket in range(MAX_BUCKETS):
+            if self._counts[bucket] == 0:
+                continue
+            cumulative += self._counts[bucket]
+            upper = 2.0 ** ((bucket + 1) / <double>SUB_BUCKETS) - 1.0
+            if upper > self.max:
+                upper = self.max
+            while idx < n and cumulative >= <double>thresholds[idx]:
+                results.append(upper)
+                idx += 1
+            if idx == n:
+                break
+        while idx < n:
+            results.append(self.max)
+            idx += 1
+        return results
@@ -0,0 +1,54 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+"""
+Compiled ring buffer for the PriorityQueue hot path.
+
+Optional accelerator: build in place with
+
+    cythonize -i whisperlivekit/performance/_ring.pyx
+
+If the compiled module is unavailable, connection.py falls back to a
+pure-Python implementation with an identical interface.
+"""
+
+
+cdef class Ring:
+    """Fixed-capacity single-lock ring buffer over a pre-allocated slot list."""
+
+    cdef Py_ssize_t _head
+    cdef Py_ssize_t _tail
+    cdef Py_ssize_t _count
+    cdef Py_ssize_t _cap
+    cdef list _slots
+
+    def __cinit__(self, Py_ssize_t capacity):
+        self._slots = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._cap = capacity
+
+    cpdef bint put_nowait(self, object item):
+        """Append item; returns False if the ring is full."""
+        if self._count == self._cap:
+            return False
+        self._slots[self._tail] = item
+        self._tail += 1
+        if self._tail == self._cap:
+            self._tail = 0
+        self._count += 1
+        return True
+
+    cpdef object get_nowait(self):
+        """Pop the oldest item; caller must check emptiness first."""
+        item = self._slots[self._head]
+        self._slots[self._head] = None
+        self._head += 1
+        if self._head == self._cap:
+            self._head = 0
+        self._count -= 1
+        return item
+
+    def __len__(self):
+        return self._count
@@ -0,0 +1,48 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+"""
+Compiled copy kernels for the CircularAudioBuffer fallback path.
+
+Optional accelerator: build in place with
+
+    cythonize -i whisperlivekit/performance/_ring_buffer.pyx
+
+memory.py falls back to numpy slice assignments when the compiled
+module is unavailable. Only the non-mirrored buffer path uses these
+kernels; with a mirrored mapping a single slice copy already suffices.
+Both kernels release the GIL, so producer and consumer threads can
+memcpy concurrently.
+"""
+
+from libc.string cimport memcpy
+
+
+cpdef ring_write(float[::1] buf, Py_ssize_t cap, Py_ssize_t tail, const float[::1] src):
+    """Copy src into buf at tail, splitting at the wrap point if needed."""
+    cdef Py_ssize_t n = src.shape[0]
+    cdef Py_ssize_t first
+    if n == 0:
+        return
+    with nogil:
+        if tail + n <= cap:
+            memcpy(&buf[tail], &src[0], n * sizeof(float))
+        else:
+            first = cap - tail
+            memcpy(&buf[tail], &src[0], first * sizeof(float))
+            memcpy(&buf[0], &src[first], (n - first) * sizeof(float))
+
+
+cpdef ring_read(const float[::1] buf, Py_ssize_t cap, Py_ssize_t head, float[::1] dst):
+    """Copy len(dst) samples out of buf starting at head into dst."""
+    cdef Py_ssize_t n = dst.shape[0]
+    cdef Py_ssize_t first
+    if n == 0:
+        return
+    with nogil:
+        if head + n <= cap:
+            memcpy(&dst[0], &buf[head], n * sizeof(float))
+        else:
+            first = cap - head
+            memcpy(&dst[0], &buf[head], first * sizeof(float))
+            memcpy(&dst[first], &buf[0], (n - first) * sizeof(float))
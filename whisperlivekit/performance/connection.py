@@ -12,16 +12,56 @@ import asyncio
 import logging
 import time
 import uuid
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable, Set
+from typing import Dict, List, Optional, Any
 from enum import Enum
-import weakref
 import threading
-from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Compiled fast path (build with: cythonize -i whisperlivekit/performance/_ring.pyx)
+    from ._ring import Ring as _Ring
+except ImportError:
+    class _Ring:
+        """Fixed-capacity ring buffer over a pre-allocated slot list.
+
+        Pure-Python fallback for the Cython implementation in _ring.pyx;
+        keeps the same head/tail/count layout so the two are interchangeable.
+        """
+
+        __slots__ = ('_slots', '_head', '_tail', '_count', '_cap')
+
+        def __init__(self, capacity: int):
+            self._slots = [None] * capacity
+            self._head = 0
+            self._tail = 0
+            self._count = 0
+            self._cap = capacity
+
+        def put_nowait(self, item) -> bool:
+            if self._count == self._cap:
+                return False
+            self._slots[self._tail] = item
+            self._tail += 1
+            if self._tail == self._cap:
+                self._tail = 0
+            self._count += 1
+            return True
+
+        def get_nowait(self):
+            item = self._slots[self._head]
+            self._slots[self._head] = None
+            self._head += 1
+            if self._head == self._cap:
+                self._head = 0
+            self._count -= 1
+            return item
+
+        def __len__(self) -> int:
+            return self._count
+
 class ConnectionState(Enum):
     """WebSocket connection states."""
     CONNECTING = "connecting"
@@ -42,6 +82,7 @@ class ConnectionInfo:
     bytes_processed: int = 0
     messages_processed: int = 0
     error_count: int = 0
+    load: int = 0
     client_ip: Optional[str] = None
     user_agent: Optional[str] = None
 
@@ -60,19 +101,24 @@ class PriorityQueue:
         self.max_size = max_size
         self.priority_levels = priority_levels
         
-        # One queue per priority level (0 = highest priority)
-        self._queues: List[deque] = [deque() for _ in range(priority_levels)]
-        self._sizes = [0] * priority_levels
+        # One ring buffer per priority level (0 = highest priority)
+        self._queues: List[_Ring] = [_Ring(max_size) for _ in range(priority_levels)]
         self._total_size = 0
         
         self._lock = asyncio.Lock()
-        self._not_empty = asyncio.Condition(self._lock)
-        self._not_full = asyncio.Condition(self._lock)
+        self._has_items = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
         
         # Statistics
         self._enqueued = 0
         self._dequeued = 0
         self._dropped = 0
+
+        # Cached stats view, refreshed only when counters change
+        self._stats_version = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_version = -1
         
     async def put(self, item: Any, priority: int = 1, timeout: Optional[float] = None) -> bool:
         """
@@ -88,34 +134,48 @@ class PriorityQueue:
         """
         if priority < 0 or priority >= self.priority_levels:
             priority = self.priority_levels - 1
-            
-        async with self._lock:
-            # Wait for space if queue is full
-            if self._total_size >= self.max_size:
-                if timeout is None:
-                    await self._not_full.wait()
-                else:
-                    try:
-                        await asyncio.wait_for(self._not_full.wait(), timeout)
-                    except asyncio.TimeoutError:
-                        self._dropped += 1
-                        return False
-            
-            # Check again after waiting
-            if self._total_size >= self.max_size:
-                self._dropped += 1
-                return False
-            
-            # Add to appropriate priority queue
-            self._queues[priority].append(item)
-            self._sizes[priority] += 1
-            self._total_size += 1
-            self._enqueued += 1
-            
-            # Notify waiting consumers
-            self._not_empty.notify()
-            
-            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            async with self._lock:
+                if self._total_size < self.max_size:
+                    return self._put_locked(item, priority)
+                # Re-arm the event under the lock so the wait below
+                # cannot be satisfied by a stale set from a slot another
+                # producer already took
+                self._has_space.clear()
+
+            # Wait for space outside the lock. The event wakes every
+            # blocked producer for a single freed slot, so losers loop
+            # back and wait again instead of counting a drop
+            if deadline is None:
+                await self._has_space.wait()
+            else:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    await asyncio.wait_for(self._has_space.wait(), remaining)
+                except asyncio.TimeoutError:
+                    self._dropped += 1
+                    self._stats_version += 1
+                    return False
+
+    def _put_locked(self, item: Any, priority: int) -> bool:
+        """Append item to its priority ring; caller holds the lock."""
+        self._stats_version += 1
+        if not self._queues[priority].put_nowait(item):
+            self._dropped += 1
+            return False
+        self._total_size += 1
+        self._enqueued += 1
+
+        # Notify waiting consumers
+        self._has_items.set()
+        if self._total_size >= self.max_size:
+            self._has_space.clear()
+
+        return True
     
     async def get(self, timeout: Optional[float] = None) -> Optional[Any]:
         """
@@ -127,48 +187,58 @@ class PriorityQueue:
         Returns:
             Next item or None if timeout
         """
-        async with self._lock:
-            # Wait for items if queue is empty
-            while self._total_size == 0:
-                if timeout is None:
-                    await self._not_empty.wait()
-                else:
-                    try:
-                        await asyncio.wait_for(self._not_empty.wait(), timeout)
-                    except asyncio.TimeoutError:
-                        return None
-            
-            # Get item from highest priority non-empty queue
-            for priority in range(self.priority_levels):
-                if self._sizes[priority] > 0:
-                    item = self._queues[priority].popleft()
-                    self._sizes[priority] -= 1
-                    self._total_size -= 1
-                    self._dequeued += 1
-                    
-                    # Notify waiting producers
-                    self._not_full.notify()
-                    
-                    return item
-            
-            return None
+        while True:
+            async with self._lock:
+                if self._total_size > 0:
+                    # Get item from highest priority non-empty ring
+                    for priority in range(self.priority_levels):
+                        if len(self._queues[priority]) > 0:
+                            item = self._queues[priority].get_nowait()
+                            self._total_size -= 1
+                            self._dequeued += 1
+                            self._stats_version += 1
+
+                            # Notify waiting producers
+                            self._has_space.set()
+                            if self._total_size == 0:
+                                self._has_items.clear()
+
+                            return item
+
+            # Wait for items outside the lock
+            if timeout is None:
+                await self._has_items.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._has_items.wait(), timeout)
+                except asyncio.TimeoutError:
+                    return None
     
     def qsize(self) -> int:
         """Get total queue size."""
         return self._total_size
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get queue statistics."""
-        return {
+        """Get queue statistics (cached until the queue changes).
+
+        Callers get a copy they can safely mutate.
+        """
+        if self._stats_cache_version == self._stats_version:
+            return dict(self._stats_cache)
+
+        stats = {
             'total_size': self._total_size,
             'max_size': self.max_size,
-            'priority_sizes': self._sizes.copy(),
+            'priority_sizes': [len(q) for q in self._queues],
             'utilization_percent': (self._total_size / self.max_size) * 100,
             'enqueued': self._enqueued,
             'dequeued': self._dequeued,
             'dropped': self._dropped,
             'drop_rate_percent': (self._dropped / max(1, self._enqueued)) * 100
         }
+        self._stats_cache = stats
+        self._stats_cache_version = self._stats_version
+        return dict(stats)
 
 class ConnectionPool:
     """
@@ -194,17 +264,31 @@ class ConnectionPool:
         
         # Connection storage
         self._connections: Dict[str, ConnectionInfo] = {}
-        self._connection_loads: Dict[str, int] = defaultdict(int)
         self._lock = asyncio.Lock()
         
         # Cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
         
-        # Statistics
+        # Statistics, maintained incrementally on state transitions
         self._total_connections = 0
         self._peak_connections = 0
         self._rejected_connections = 0
+        self._state_counts: Dict[str, int] = defaultdict(int)
+        self._total_load = 0
+
+        # Cached stats view, refreshed when the pool changes and at
+        # least once per second (active_connections is time-dependent)
+        self._stats_version = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_version = -1
+        self._stats_cache_time = 0.0
+
+    def _set_state(self, conn: ConnectionInfo, new_state: ConnectionState):
+        """Transition a connection's state, keeping the histogram current."""
+        self._state_counts[conn.state.value] -= 1
+        self._state_counts[new_state.value] += 1
+        conn.state = new_state
         
     async def start(self):
         """Start the connection pool."""
@@ -242,6 +326,7 @@ class ConnectionPool:
             # Check connection limit
             if len(self._connections) >= self.max_connections:
                 self._rejected_connections += 1
+                self._stats_version += 1
                 logger.warning(f"Connection rejected: pool full ({len(self._connections)}/{self.max_connections})")
                 return None
             
@@ -258,8 +343,9 @@ class ConnectionPool:
             )
             
             self._connections[connection_id] = conn_info
-            self._connection_loads[connection_id] = 0
+            self._state_counts[conn_info.state.value] += 1
             self._total_connections += 1
+            self._stats_version += 1
             
             # Update peak connections
             current_count = len(self._connections)
@@ -272,9 +358,11 @@ class ConnectionPool:
     async def remove_connection(self, connection_id: str):
         """Remove a connection from the pool."""
         async with self._lock:
-            if connection_id in self._connections:
-                del self._connections[connection_id]
-                del self._connection_loads[connection_id]
+            conn = self._connections.pop(connection_id, None)
+            if conn is not None:
+                self._state_counts[conn.state.value] -= 1
+                self._total_load -= conn.load
+                self._stats_version += 1
                 logger.debug(f"Connection removed: {connection_id} ({len(self._connections)} remaining)")
     
     async def update_connection_activity(self, 
@@ -288,6 +376,7 @@ class ConnectionPool:
                 conn.last_activity = time.time()
                 conn.bytes_processed += bytes_processed
                 conn.messages_processed += messages_processed
+                self._stats_version += 1
     
     async def get_least_loaded_connection(self) -> Optional[str]:
         """Get the connection ID with the lowest load."""
@@ -296,13 +385,11 @@ class ConnectionPool:
                 return None
             
             # Find connection with minimum load
-            min_load = min(self._connection_loads.values())
-            for conn_id, load in self._connection_loads.items():
-                if load == min_load:
-                    conn_info = self._connections.get(conn_id)
-                    if (conn_info and 
-                        conn_info.state == ConnectionState.CONNECTED and
-                        load < self.max_concurrent_per_connection):
+            min_load = min(conn.load for conn in self._connections.values())
+            for conn_id, conn_info in self._connections.items():
+                if conn_info.load == min_load:
+                    if (conn_info.state == ConnectionState.CONNECTED and
+                        conn_info.load < self.max_concurrent_per_connection):
                         return conn_id
             
             return None
@@ -318,28 +405,33 @@ class ConnectionPool:
             True if slot acquired, False if connection is overloaded
         """
         async with self._lock:
-            if connection_id not in self._connections:
+            conn = self._connections.get(connection_id)
+            if conn is None:
                 return False
-            
-            current_load = self._connection_loads[connection_id]
-            if current_load >= self.max_concurrent_per_connection:
+
+            if conn.load >= self.max_concurrent_per_connection:
                 return False
-            
-            self._connection_loads[connection_id] += 1
-            self._connections[connection_id].state = ConnectionState.PROCESSING
+
+            conn.load += 1
+            self._total_load += 1
+            self._stats_version += 1
+            if conn.state is not ConnectionState.PROCESSING:
+                self._set_state(conn, ConnectionState.PROCESSING)
             return True
     
     async def release_connection_slot(self, connection_id: str):
         """Release a processing slot for a connection."""
         async with self._lock:
-            if connection_id in self._connections:
-                current_load = self._connection_loads[connection_id]
-                if current_load > 0:
-                    self._connection_loads[connection_id] -= 1
-                
+            conn = self._connections.get(connection_id)
+            if conn is not None:
+                if conn.load > 0:
+                    conn.load -= 1
+                    self._total_load -= 1
+                    self._stats_version += 1
+
                 # Update state based on remaining load
-                if self._connection_loads[connection_id] == 0:
-                    self._connections[connection_id].state = ConnectionState.IDLE
+                if conn.load == 0 and conn.state is not ConnectionState.IDLE:
+                    self._set_state(conn, ConnectionState.IDLE)
     
     async def _cleanup_loop(self):
         """Background task to clean up inactive connections."""
@@ -360,7 +452,7 @@ class ConnectionPool:
         async with self._lock:
             for conn_id, conn_info in self._connections.items():
                 if (current_time - conn_info.last_activity > self.connection_timeout and
-                    self._connection_loads[conn_id] == 0):
+                    conn_info.load == 0):
                     inactive_connections.append(conn_id)
         
         for conn_id in inactive_connections:
@@ -372,34 +464,40 @@ class ConnectionPool:
         return len(self._connections)
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get connection pool statistics."""
-        current_time = time.time()
-        
-        # Calculate connection states
-        state_counts = defaultdict(int)
-        total_load = 0
+        """Get connection pool statistics.
+
+        The view is cached, but active_connections decays with time, so
+        the cache also expires after a second even when the pool itself
+        has not changed. Callers get a copy they can safely mutate.
+        """
+        now = time.time()
+        if (self._stats_cache_version == self._stats_version
+                and now - self._stats_cache_time < 1.0):
+            return dict(self._stats_cache)
+
+        # State histogram and load are maintained incrementally; only the
+        # recent-activity count still needs a pass over the connections
+        activity_cutoff = now - 60  # Active in last minute
         active_connections = 0
-        
         for conn_info in self._connections.values():
-            state_counts[conn_info.state.value] += 1
-            
-            if current_time - conn_info.last_activity < 60:  # Active in last minute
+            if conn_info.last_activity > activity_cutoff:
                 active_connections += 1
-        
-        for load in self._connection_loads.values():
-            total_load += load
-        
-        return {
+
+        stats = {
             'total_connections': len(self._connections),
             'max_connections': self.max_connections,
             'active_connections': active_connections,
             'peak_connections': self._peak_connections,
             'rejected_connections': self._rejected_connections,
-            'total_load': total_load,
-            'average_load': total_load / max(1, len(self._connections)),
-            'state_distribution': dict(state_counts),
+            'total_load': self._total_load,
+            'average_load': self._total_load / max(1, len(self._connections)),
+            'state_distribution': {state: count for state, count in self._state_counts.items() if count},
             'utilization_percent': (len(self._connections) / self.max_connections) * 100
         }
+        self._stats_cache = stats
+        self._stats_cache_version = self._stats_version
+        self._stats_cache_time = now
+        return dict(stats)
 
 class RateLimiter:
     """
@@ -420,57 +518,76 @@ class RateLimiter:
         self.burst_size = burst_size
         self.per_connection = per_connection
         
-        # Token buckets per connection (or global)
-        self._buckets: Dict[str, Dict[str, float]] = defaultdict(lambda: {
-            'tokens': burst_size,
-            'last_refill': time.time()
-        })
-        
+        # Token buckets per connection (or global), stored as immutable
+        # (tokens, last_refill) tuples so a bucket update is a single
+        # GIL-atomic dict-item replacement
+        self._buckets: Dict[str, tuple] = {}
+
+        # Only guards bucket creation; the check path is lock-free
         self._lock = threading.Lock()
-        
+
+        # Cached stats view, refreshed only after new checks arrive
+        self._stats_version = 0
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_version = -1
+
     def is_allowed(self, connection_id: str = "global") -> bool:
         """
         Check if request is allowed for the given connection.
-        
+
         Args:
             connection_id: Connection ID (or "global" for global limiting)
-            
+
         Returns:
             True if request is allowed, False if rate limited
         """
         if not self.per_connection:
             connection_id = "global"
-        
-        with self._lock:
-            bucket = self._buckets[connection_id]
-            current_time = time.time()
-            
-            # Refill tokens based on elapsed time
-            elapsed = current_time - bucket['last_refill']
-            tokens_to_add = elapsed * self.requests_per_second
-            bucket['tokens'] = min(self.burst_size, bucket['tokens'] + tokens_to_add)
-            bucket['last_refill'] = current_time
-            
-            # Check if request can be served
-            if bucket['tokens'] >= 1.0:
-                bucket['tokens'] -= 1.0
-                return True
-            else:
-                return False
-    
+
+        current_time = time.time()
+        state = self._buckets.get(connection_id)
+        if state is None:
+            with self._lock:
+                state = self._buckets.setdefault(
+                    connection_id, (float(self.burst_size), current_time))
+
+        # Refill tokens based on elapsed time, then publish the new state
+        # with one dict store (atomic under the GIL; there is no
+        # cross-connection invariant to protect)
+        tokens, last_refill = state
+        tokens = min(self.burst_size,
+                     tokens + (current_time - last_refill) * self.requests_per_second)
+
+        self._stats_version += 1
+        if tokens >= 1.0:
+            self._buckets[connection_id] = (tokens - 1.0, current_time)
+            return True
+        else:
+            self._buckets[connection_id] = (tokens, current_time)
+            return False
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get rate limiter statistics."""
-        with self._lock:
-            active_connections = len(self._buckets)
-            total_tokens = sum(bucket['tokens'] for bucket in self._buckets.values())
-            
-            return {
-                'requests_per_second': self.requests_per_second,
-                'burst_size': self.burst_size,
-                'active_connections': active_connections,
-                'total_available_tokens': total_tokens,
-                'average_tokens_per_connection': total_tokens / max(1, active_connections)
-            }
+        """Get rate limiter statistics (cached until new checks arrive).
+
+        Callers get a copy they can safely mutate.
+        """
+        if self._stats_cache_version == self._stats_version:
+            return dict(self._stats_cache)
+
+        buckets = list(self._buckets.values())
+        active_connections = len(buckets)
+        total_tokens = sum(tokens for tokens, _ in buckets)
+
+        stats = {
+            'requests_per_second': self.requests_per_second,
+            'burst_size': self.burst_size,
+            'active_connections': active_connections,
+            'total_available_tokens': total_tokens,
+            'average_tokens_per_connection': total_tokens / max(1, active_connections)
+        }
+        self._stats_cache = stats
+        self._stats_cache_version = self._stats_version
+        return dict(stats)
 
 class LoadBalancer:
     """
@@ -568,14 +685,28 @@ connection_pool = ConnectionPool()
 rate_limiter = RateLimiter()
 load_balancer = LoadBalancer()
 
-@asynccontextmanager
-async def managed_connection(connection_id: str = None, **kwargs):
-    """Context manager for automatic connection lifecycle management."""
-    conn_id = await connection_pool.add_connection(connection_id, **kwargs)
-    if conn_id is None:
-        raise RuntimeError("Failed to acquire connection from pool")
-    
-    try:
-        yield conn_id
-    finally:
-        await connection_pool.remove_connection(conn_id)
\ No newline at end of file
+class ManagedConnection:
+    """Context manager for automatic connection lifecycle management.
+
+    Hand-written __aenter__/__aexit__ instead of @asynccontextmanager to
+    skip the generator send/throw machinery on this per-session hot path.
+    """
+
+    __slots__ = ('_connection_id', '_kwargs', 'conn_id')
+
+    def __init__(self, connection_id: str = None, **kwargs):
+        self._connection_id = connection_id
+        self._kwargs = kwargs
+        self.conn_id: Optional[str] = None
+
+    async def __aenter__(self) -> str:
+        self.conn_id = await connection_pool.add_connection(self._connection_id, **self._kwargs)
+        if self.conn_id is None:
+            raise RuntimeError("Failed to acquire connection from pool")
+        return self.conn_id
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await connection_pool.remove_connection(self.conn_id)
+
+# Keep the established call-site spelling: async with managed_connection(...)
+managed_connection = ManagedConnection
\ No newline at end of file
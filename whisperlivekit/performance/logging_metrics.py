@@ -14,14 +14,34 @@ import json
 import logging
 import time
 from collections import defaultdict, deque
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Callable, Union
 from enum import Enum
 import threading
+import array
+import math
+import os
 from pathlib import Path
-import queue
 import sys
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with the ASR backends
+    np = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+if np is not None:
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - optional accelerator
+        njit = None
+else:
+    njit = None
+
 class LogLevel(Enum):
     """Enhanced log levels with performance considerations."""
     TRACE = 5      # Very detailed tracing (performance impact)
@@ -51,8 +71,14 @@ class LogEntry:
     thread_id: int = 0
     process_id: int = 0
     context: Dict[str, Any] = field(default_factory=dict)
+    # Logger-wide context shared by reference; per-call kwargs live in
+    # `context` so no merged dict is built on the hot path
+    context_shared: tuple = ()
     metrics: Dict[str, Any] = field(default_factory=dict)
-    tags: List[str] = field(default_factory=list)
+    tags: tuple = ()
+    # (f_code, f_lineno, f_globals) captured on the hot path; resolved to
+    # module/function/line strings by the worker thread
+    frame_info: Optional[tuple] = None
 
 @dataclass 
 class Metric:
@@ -64,6 +90,109 @@ class Metric:
     tags: Dict[str, str] = field(default_factory=dict)
     unit: str = ""
 
+# Power of two so picking a shard is a mask, not a modulo
+_N_SHARDS = 64
+
+# Log-linear bucket layout: 32 sub-buckets per power of two gives ~3%
+# relative error on reported percentiles
+_HIST_SUB_BUCKETS = 32
+_HIST_MAX_BUCKETS = 1408  # covers values up to ~2**44
+
+if np is not None:
+    def _bucket_indices(values):
+        """Vectorized bucket indices for an array of non-negative values."""
+        buckets = (np.log2(values + 1.0) * _HIST_SUB_BUCKETS).astype(np.int64)
+        return np.clip(buckets, 0, _HIST_MAX_BUCKETS - 1)
+
+    if njit is not None:
+        # Compiled kernel amortizes well on drained batches
+        _bucket_indices = njit(cache=True)(_bucket_indices)
+
+try:
+    # Compiled fast path (build with: cythonize -i whisperlivekit/performance/_metrics_core.pyx)
+    from ._metrics_core import BucketHistogram as _BucketHistogram
+except ImportError:
+    class _BucketHistogram:
+        """HDR-style log-bucket histogram with exact count/sum/min/max.
+
+        Recording is an O(1) bucket increment; percentile queries are one
+        cumulative sweep over the bucket array regardless of sample count.
+        """
+
+        __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+        def __init__(self):
+            self.counts = array.array('Q', bytes(8 * _HIST_MAX_BUCKETS))
+            self.count = 0
+            self.total = 0.0
+            self.min = math.inf
+            self.max = -math.inf
+
+        def record(self, value: float):
+            """Record one sample."""
+            bucket = int(math.log2(value + 1.0) * _HIST_SUB_BUCKETS) if value > 0 else 0
+            if bucket >= _HIST_MAX_BUCKETS:
+                bucket = _HIST_MAX_BUCKETS - 1
+            self.counts[bucket] += 1
+            self.count += 1
+            self.total += value
+            if value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+
+        def record_many(self, values) -> None:
+            """Record a batch of samples with one vectorized binning pass."""
+            if not len(values):
+                return
+            if np is not None:
+                values = np.asarray(values, dtype=np.float64)
+                buckets = _bucket_indices(values)
+                binned = np.bincount(buckets, minlength=_HIST_MAX_BUCKETS)
+                for bucket in np.nonzero(binned)[0]:
+                    self.counts[bucket] += int(binned[bucket])
+                self.count += len(values)
+                self.total += float(values.sum())
+                lo = float(values.min())
+                hi = float(values.max())
+                if lo < self.min:
+                    self.min = lo
+                if hi > self.max:
+                    self.max = hi
+            else:
+                for value in values:
+                    self.record(value)
+
+        def percentiles(self, fractions) -> List[float]:
+            """Values at the given ascending fractions, in one cumulative sweep."""
+            thresholds = [f * self.count for f in fractions]
+
+            if np is not None:
+                # Vectorized: one cumsum over the bucket counts, then a
+                # binary search per requested percentile, all in C
+                cumulative_counts = np.cumsum(np.frombuffer(self.counts, dtype=np.uint64))
+                buckets = np.searchsorted(cumulative_counts, thresholds)
+                return [min(2.0 ** ((int(bucket) + 1) / _HIST_SUB_BUCKETS) - 1.0, self.max)
+                        for bucket in buckets]
+
+            results = []
+            idx = 0
+            cumulative = 0
+            for bucket, bucket_count in enumerate(self.counts):
+                if not bucket_count:
+                    continue
+                cumulative += bucket_count
+                upper = 2.0 ** ((bucket + 1) / _HIST_SUB_BUCKETS) - 1.0
+                while idx < len(thresholds) and cumulative >= thresholds[idx]:
+                    results.append(min(upper, self.max))
+                    idx += 1
+                if idx == len(thresholds):
+                    break
+            while idx < len(thresholds):
+                results.append(self.max)
+                idx += 1
+            return results
+
 class MetricsCollector:
     """
     High-performance metrics collection system.
@@ -75,19 +204,38 @@ class MetricsCollector:
     - Real-time statistics
     """
     
-    def __init__(self, max_metrics: int = 10000, aggregation_window: int = 60):
+    def __init__(self, max_metrics: int = 10000, aggregation_window: int = 60,
+                 enable_raw_series: bool = False):
         self.max_metrics = max_metrics
         self.aggregation_window = aggregation_window
         
-        # Metric storage
-        self._metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_metrics))
-        self._counters: Dict[str, float] = defaultdict(float)
+        # Metric storage; the raw time series is opt-in debugging aid
+        # storing plain (timestamp, value) pairs
+        self._raw_series: Optional[Dict[str, deque]] = (
+            defaultdict(lambda: deque(maxlen=max_metrics)) if enable_raw_series else None)
         self._gauges: Dict[str, float] = defaultdict(float)
-        self._histograms: Dict[str, List[float]] = defaultdict(list)
-        self._timings: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
-        
-        # Thread safety
-        self._lock = threading.RLock()
+
+        # Counter/histogram/timing state is sharded by key hash so
+        # recording threads with disjoint keys take disjoint locks.
+        # Counters need the lock because += is a read-modify-write;
+        # gauges are single GIL-atomic dict stores and need none.
+        self._counter_shards: List[Dict[str, float]] = [
+            defaultdict(float) for _ in range(_N_SHARDS)]
+        self._hist_shards: List[Dict[str, _BucketHistogram]] = [
+            defaultdict(_BucketHistogram) for _ in range(_N_SHARDS)]
+        self._timing_shards: List[Dict[str, _BucketHistogram]] = [
+            defaultdict(_BucketHistogram) for _ in range(_N_SHARDS)]
+        self._shard_locks: List[threading.Lock] = [
+            threading.Lock() for _ in range(_N_SHARDS)]
+
+        # Memoized stats per key; a histogram's sample count doubles as
+        # its generation, so new samples invalidate implicitly
+        self._hist_stats_cache: Dict[str, tuple] = {}
+        self._timing_stats_cache: Dict[str, tuple] = {}
+
+        # Serialized (name, tags) -> key strings; tag dicts repeat in
+        # steady state so the sort/join only runs on first sight
+        self._key_cache: Dict[tuple, str] = {}
         
         # Statistics
         self._total_metrics = 0
@@ -95,53 +243,70 @@ class MetricsCollector:
         
     def increment(self, name: str, value: float = 1.0, tags: Dict[str, str] = None):
         """Increment a counter metric."""
-        with self._lock:
-            key = self._build_key(name, tags)
-            self._counters[key] += value
-            self._record_metric(Metric(name, MetricType.COUNTER, value, tags=tags or {}))
-    
+        key = self._build_key(name, tags)
+        shard = hash(key) & (_N_SHARDS - 1)
+        with self._shard_locks[shard]:
+            self._counter_shards[shard][key] += value
+        self._note_sample(key, value)
+
     def gauge(self, name: str, value: float, tags: Dict[str, str] = None):
         """Set a gauge metric."""
-        with self._lock:
-            key = self._build_key(name, tags)
-            self._gauges[key] = value
-            self._record_metric(Metric(name, MetricType.GAUGE, value, tags=tags or {}))
+        key = self._build_key(name, tags)
+        self._gauges[key] = value
+        self._note_sample(key, value)
     
     def histogram(self, name: str, value: float, tags: Dict[str, str] = None):
         """Record a histogram value."""
-        with self._lock:
-            key = self._build_key(name, tags)
-            self._histograms[key].append(value)
-            # Keep only recent values
-            if len(self._histograms[key]) > 1000:
-                self._histograms[key] = self._histograms[key][-500:]
-            self._record_metric(Metric(name, MetricType.HISTOGRAM, value, tags=tags or {}))
+        key = self._build_key(name, tags)
+        shard = hash(key) & (_N_SHARDS - 1)
+        with self._shard_locks[shard]:
+            self._hist_shards[shard][key].record(value)
+        self._note_sample(key, value)
     
+    def histogram_many(self, name: str, values, tags: Dict[str, str] = None):
+        """Record a batch of histogram values in one binning pass."""
+        key = self._build_key(name, tags)
+        shard = hash(key) & (_N_SHARDS - 1)
+        with self._shard_locks[shard]:
+            self._hist_shards[shard][key].record_many(values)
+        self._total_metrics += len(values)
+
     def timing(self, name: str, duration_ms: float, tags: Dict[str, str] = None):
         """Record a timing measurement."""
-        with self._lock:
-            key = self._build_key(name, tags)
-            self._timings[key].append(duration_ms)
-            self._record_metric(Metric(name, MetricType.TIMING, duration_ms, tags=tags or {}, unit="ms"))
-    
-    def _record_metric(self, metric: Metric):
-        """Record a metric in the time series."""
-        key = self._build_key(metric.name, metric.tags)
-        self._metrics[key].append(metric)
+        key = self._build_key(name, tags)
+        shard = hash(key) & (_N_SHARDS - 1)
+        with self._shard_locks[shard]:
+            self._timing_shards[shard][key].record(duration_ms)
+        self._note_sample(key, duration_ms)
+    
+    def _note_sample(self, key: str, value: float):
+        """Per-sample bookkeeping shared by all record methods."""
+        # deque.append is GIL-atomic; the total is a statistic where a
+        # rare lost increment is acceptable
+        if self._raw_series is not None:
+            self._raw_series[key].append((time.time(), value))
         self._total_metrics += 1
     
     def _build_key(self, name: str, tags: Dict[str, str] = None) -> str:
         """Build a unique key for a metric."""
         if not tags:
             return name
-        
-        tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
-        return f"{name}[{tag_str}]"
+
+        cache_key = (name, tuple(tags.items()))
+        key = self._key_cache.get(cache_key)
+        if key is None:
+            tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
+            key = f"{name}[{tag_str}]"
+            if len(self._key_cache) > 4096:
+                self._key_cache.clear()
+            self._key_cache[cache_key] = key
+        return key
     
     def get_counter(self, name: str, tags: Dict[str, str] = None) -> float:
         """Get current counter value."""
         key = self._build_key(name, tags)
-        return self._counters.get(key, 0.0)
+        shard = hash(key) & (_N_SHARDS - 1)
+        return self._counter_shards[shard].get(key, 0.0)
     
     def get_gauge(self, name: str, tags: Dict[str, str] = None) -> Optional[float]:
         """Get current gauge value."""
@@ -151,57 +316,94 @@ class MetricsCollector:
     def get_histogram_stats(self, name: str, tags: Dict[str, str] = None) -> Dict[str, float]:
         """Get histogram statistics."""
         key = self._build_key(name, tags)
-        values = self._histograms.get(key, [])
-        
-        if not values:
-            return {}
-        
-        sorted_values = sorted(values)
-        count = len(sorted_values)
-        
-        return {
-            'count': count,
-            'min': sorted_values[0],
-            'max': sorted_values[-1],
-            'mean': sum(sorted_values) / count,
-            'p50': sorted_values[int(count * 0.5)],
-            'p90': sorted_values[int(count * 0.9)],
-            'p95': sorted_values[int(count * 0.95)],
-            'p99': sorted_values[int(count * 0.99)],
-        }
+        shard = hash(key) & (_N_SHARDS - 1)
+        with self._shard_locks[shard]:
+            hist = self._hist_shards[shard].get(key)
+            if hist is None or hist.count == 0:
+                return {}
+
+            cached = self._hist_stats_cache.get(key)
+            if cached is not None and cached[0] == hist.count:
+                return cached[1]
+
+            p50, p90, p95, p99 = hist.percentiles((0.5, 0.9, 0.95, 0.99))
+            stats = {
+                'count': hist.count,
+                'min': hist.min,
+                'max': hist.max,
+                'mean': hist.total / hist.count,
+                'p50': p50,
+                'p90': p90,
+                'p95': p95,
+                'p99': p99,
+            }
+            self._hist_stats_cache[key] = (hist.count, stats)
+            return stats
     
+    def get_percentiles(self, name: str, percentiles: List[float],
+                        tags: Dict[str, str] = None) -> List[float]:
+        """Get values at the given fractions (0-1] for a histogram or timing.
+
+        All requested percentiles are answered from a single cumulative
+        sweep over the bucket counts, so asking for many quantiles costs
+        the same as asking for one. Results match the input order.
+        """
+        key = self._build_key(name, tags)
+        shard = hash(key) & (_N_SHARDS - 1)
+        with self._shard_locks[shard]:
+            hist = (self._hist_shards[shard].get(key)
+                    or self._timing_shards[shard].get(key))
+            if hist is None or hist.count == 0:
+                return []
+
+            # Sweep in ascending order, then restore the caller's order
+            order = sorted(range(len(percentiles)), key=percentiles.__getitem__)
+            values = hist.percentiles([percentiles[i] for i in order])
+
+        result = [0.0] * len(percentiles)
+        for position, index in enumerate(order):
+            result[index] = values[position]
+        return result
+
     def get_timing_stats(self, name: str, tags: Dict[str, str] = None) -> Dict[str, float]:
         """Get timing statistics."""
         key = self._build_key(name, tags)
-        timings = list(self._timings.get(key, []))
-        
-        if not timings:
-            return {}
-        
-        sorted_timings = sorted(timings)
-        count = len(sorted_timings)
-        
-        return {
-            'count': count,
-            'min_ms': sorted_timings[0],
-            'max_ms': sorted_timings[-1],
-            'mean_ms': sum(sorted_timings) / count,
-            'p50_ms': sorted_timings[int(count * 0.5)],
-            'p90_ms': sorted_timings[int(count * 0.9)],
-            'p95_ms': sorted_timings[int(count * 0.95)],
-            'p99_ms': sorted_timings[int(count * 0.99)],
-        }
+        shard = hash(key) & (_N_SHARDS - 1)
+        with self._shard_locks[shard]:
+            hist = self._timing_shards[shard].get(key)
+            if hist is None or hist.count == 0:
+                return {}
+
+            cached = self._timing_stats_cache.get(key)
+            if cached is not None and cached[0] == hist.count:
+                return cached[1]
+
+            p50, p90, p95, p99 = hist.percentiles((0.5, 0.9, 0.95, 0.99))
+            stats = {
+                'count': hist.count,
+                'min_ms': hist.min,
+                'max_ms': hist.max,
+                'mean_ms': hist.total / hist.count,
+                'p50_ms': p50,
+                'p90_ms': p90,
+                'p95_ms': p95,
+                'p99_ms': p99,
+            }
+            self._timing_stats_cache[key] = (hist.count, stats)
+            return stats
     
     def get_all_metrics(self) -> Dict[str, Any]:
         """Get all current metrics."""
-        with self._lock:
-            return {
-                'counters': dict(self._counters),
-                'gauges': dict(self._gauges),
-                'total_metrics': self._total_metrics,
-                'uptime_seconds': time.time() - self._start_time,
-                'metrics_per_second': self._total_metrics / (time.time() - self._start_time)
-            }
+        counters: Dict[str, float] = {}
+        for shard_counters in self._counter_shards:
+            counters.update(shard_counters)
+        return {
+            'counters': counters,
+            'gauges': dict(self._gauges),
+            'total_metrics': self._total_metrics,
+            'uptime_seconds': time.time() - self._start_time,
+            'metrics_per_second': self._total_metrics / (time.time() - self._start_time)
+        }
 
 class PerformanceLogger:
     """
@@ -222,86 +424,159 @@ class PerformanceLogger:
                  buffer_size: int = 1000):
         
         self.name = name
-        self.log_level = log_level
         self.enable_metrics = enable_metrics
         self.buffer_size = buffer_size
+        self.set_level(log_level)
         
         # Components
         self.metrics = MetricsCollector() if enable_metrics else None
         
-        # Async logging
-        self._log_queue = queue.Queue(maxsize=buffer_size)
+        # Async logging: an unlocked deque is the queue (append/popleft
+        # are GIL-atomic), with an Event to wake the single consumer
+        self._log_queue: deque = deque()
+        self._queue_event = threading.Event()
+
+        # Recycled LogEntry objects; the worker returns entries here after
+        # the handlers have run, so steady-state logging allocates nothing.
+        # Handlers must not retain entries beyond the handler call.
+        self._entry_pool: deque = deque()
         self._handlers: List[Callable] = []
         self._worker_thread: Optional[threading.Thread] = None
         self._running = False
         
-        # Context
-        self._context: Dict[str, Any] = {}
-        self._tags: List[str] = []
+        # Context, frozen as an items tuple so entries can share it by
+        # reference instead of merging dicts per call
+        self._context_items: tuple = ()
+        self._tags: tuple = ()
         
         # Statistics
         self._logs_written = 0
         self._logs_dropped = 0
         
     def start(self):
-        """Start the asynchronous logging worker."""
+        """Start the asynchronous logging worker.
+
+        With no handlers registered there is nothing to consume entries,
+        so the worker thread is only spawned once a handler exists.
+        """
         if self._running:
             return
         
         self._running = True
-        self._worker_thread = threading.Thread(target=self._log_worker, daemon=True)
-        self._worker_thread.start()
+        if self._handlers:
+            self._start_worker()
+
+    def _start_worker(self):
+        if self._worker_thread is None or not self._worker_thread.is_alive():
+            self._worker_thread = threading.Thread(target=self._log_worker, daemon=True)
+            self._worker_thread.start()
     
     def stop(self):
         """Stop the logging worker and flush remaining logs."""
         self._running = False
+        self._queue_event.set()
         if self._worker_thread:
             self._worker_thread.join(timeout=5.0)
+        self._flush_handlers()
+
+    def _flush_handlers(self):
+        """Flush any handlers that buffer output."""
+        for handler in self._handlers:
+            flush = getattr(handler, 'flush', None)
+            if flush is not None:
+                try:
+                    flush()
+                except Exception as e:
+                    print(f"Log handler flush error: {e}", file=sys.stderr)
     
+    def set_level(self, log_level: LogLevel):
+        """Set the minimum level; disabled level methods become no-ops."""
+        self.log_level = log_level
+        self._level_threshold = log_level.value
+        for level in LogLevel:
+            method_name = level.name.lower()
+            if level.value < self._level_threshold:
+                setattr(self, method_name, self._noop)
+            else:
+                # Restore the class implementation
+                try:
+                    delattr(self, method_name)
+                except AttributeError:
+                    pass
+
+    def _noop(self, message: str, **kwargs):
+        """Bound in place of disabled level methods."""
+
     def add_handler(self, handler: Callable[[LogEntry], None]):
         """Add a log handler function."""
         self._handlers.append(handler)
+        if self._running:
+            self._start_worker()
     
     def set_context(self, **kwargs):
         """Set logging context that will be included in all log entries."""
-        self._context.update(kwargs)
+        merged = dict(self._context_items)
+        merged.update(kwargs)
+        self._context_items = tuple(merged.items())
     
     def add_tags(self, *tags: str):
         """Add tags to all log entries."""
-        self._tags.extend(tags)
+        # Copy-on-write: queued entries keep the tuple they were given
+        self._tags = self._tags + tags
     
     def log(self, level: LogLevel, message: str, **kwargs):
         """Log a message with the specified level."""
-        if level.value < self.log_level.value:
+        if level.value < self._level_threshold:
+            return
+
+        # No consumer: record the metric but skip entry allocation,
+        # queueing and the worker wakeup entirely
+        if not self._handlers:
+            if self.metrics:
+                self.metrics.increment(f"logs.{level.name.lower()}")
+                self.metrics.increment("logs.total")
             return
         
-        # Create log entry
-        import inspect
-        frame = inspect.currentframe().f_back
-        
-        entry = LogEntry(
-            level=level,
-            message=message,
-            logger_name=self.name,
-            module=frame.f_globals.get('__name__', ''),
-            function=frame.f_code.co_name,
-            line=frame.f_lineno,
-            thread_id=threading.get_ident(),
-            process_id=os.getpid(),
-            context={**self._context, **kwargs},
-            tags=self._tags.copy()
-        )
+        # Reuse a pooled entry when one is available and fill it in
+        # place; caller frame details are captured as cheap references
+        # and resolved off the critical path by the worker
+        frame = sys._getframe(1)
+
+        try:
+            entry = self._entry_pool.pop()
+        except IndexError:
+            entry = LogEntry()
+
+        entry.timestamp = time.time()
+        entry.level = level
+        entry.message = message
+        entry.logger_name = self.name
+        entry.thread_id = threading.get_ident()
+        entry.process_id = os.getpid()
+        entry.frame_info = (frame.f_code, frame.f_lineno, frame.f_globals)
+
+        entry.context_shared = self._context_items
+        context = entry.context
+        context.clear()
+        if kwargs:
+            context.update(kwargs)
+
+        entry.tags = self._tags
         
         # Record metrics
         if self.metrics:
             self.metrics.increment(f"logs.{level.name.lower()}")
             self.metrics.increment("logs.total")
         
-        # Queue for async processing
-        try:
-            self._log_queue.put_nowait(entry)
-        except queue.Full:
+        # Queue for async processing; bounded by an approximate length
+        # check since producers never block
+        if len(self._log_queue) >= self.buffer_size:
             self._logs_dropped += 1
+            self._entry_pool.append(entry)
+            return
+
+        self._log_queue.append(entry)
+        self._queue_event.set()
     
     def trace(self, message: str, **kwargs):
         """Log trace message."""
@@ -329,14 +604,35 @@ class PerformanceLogger:
     
     def _log_worker(self):
         """Background worker to process log entries."""
-        while self._running or not self._log_queue.empty():
+        # The written count is accumulated locally and published in
+        # batches so the tight loop does not write a shared attribute
+        # (and its cache line) once per entry
+        written_pending = 0
+        while self._running or self._log_queue:
             try:
-                # Get log entry with timeout
                 try:
-                    entry = self._log_queue.get(timeout=1.0)
-                except queue.Empty:
+                    entry = self._log_queue.popleft()
+                except IndexError:
+                    # Drained: publish counters, push out buffered file
+                    # writes, then sleep until a producer signals
+                    if written_pending:
+                        self._logs_written += written_pending
+                        written_pending = 0
+                    self._flush_handlers()
+                    self._queue_event.clear()
+                    if not self._log_queue:
+                        self._queue_event.wait(timeout=1.0)
                     continue
-                
+
+                # Resolve caller info captured on the hot path
+                frame_info = entry.frame_info
+                if frame_info is not None:
+                    code, lineno, frame_globals = frame_info
+                    entry.module = frame_globals.get('__name__', '')
+                    entry.function = code.co_name
+                    entry.line = lineno
+                    entry.frame_info = None
+
                 # Process with all handlers
                 for handler in self._handlers:
                     try:
@@ -345,63 +641,154 @@ class PerformanceLogger:
                         # Avoid infinite recursion by using print
                         print(f"Log handler error: {e}", file=sys.stderr)
                 
-                self._logs_written += 1
-                self._log_queue.task_done()
+                written_pending += 1
+                if written_pending >= 1024:
+                    self._logs_written += written_pending
+                    written_pending = 0
+
+                # Recycle the entry for the next log call
+                if len(self._entry_pool) < self.buffer_size:
+                    self._entry_pool.append(entry)
                 
             except Exception as e:
                 print(f"Log worker error: {e}", file=sys.stderr)
 
+        if written_pending:
+            self._logs_written += written_pending
+
+# Log timestamps are rendered at whole-second resolution, so cache the
+# last formatted second instead of calling strftime/localtime per entry.
+# A single tuple store keeps the cache update GIL-atomic.
+_timestamp_cache = (-1, '')
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format a timestamp, reusing the previous result within a second."""
+    global _timestamp_cache
+    second = int(timestamp)
+    cached_second, cached_str = _timestamp_cache
+    if second == cached_second:
+        return cached_str
+    formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+    _timestamp_cache = (second, formatted)
+    return formatted
+
 # Log handlers
 def console_handler(entry: LogEntry):
     """Console log handler."""
-    timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.timestamp))
+    timestamp = _format_timestamp(entry.timestamp)
     level_name = entry.level.name
     
     # Format message
     message = f"[{timestamp}] {level_name:8} {entry.logger_name}: {entry.message}"
     
     # Add context if present
-    if entry.context:
-        context_str = " ".join(f"{k}={v}" for k, v in entry.context.items())
-        message += f" ({context_str})"
+    if entry.context_shared or entry.context:
+        parts = [f"{k}={v}" for k, v in entry.context_shared]
+        parts.extend(f"{k}={v}" for k, v in entry.context.items())
+        message += f" ({' '.join(parts)})"
     
     print(message)
 
-def json_file_handler(file_path: str):
-    """Create a JSON file handler."""
-    def handler(entry: LogEntry):
-        with open(file_path, 'a', encoding='utf-8') as f:
-            json.dump(asdict(entry), f, ensure_ascii=False, default=str)
-            f.write('\n')
-    return handler
+class _BatchingFileHandler:
+    """File handler base that buffers formatted lines and writes batches.
 
-def structured_file_handler(file_path: str):
-    """Create a structured text file handler."""
-    def handler(entry: LogEntry):
-        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.timestamp))
-        
-        # Build structured line
+    Only called from the single log worker thread, so no locking is
+    needed. The worker flushes pending lines when the queue drains and
+    PerformanceLogger.stop() flushes on shutdown.
+    """
+
+    def __init__(self, file_path: str, batch_size: int = 64, flush_interval: float = 1.0):
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lines: List[str] = []
+        self._last_flush = time.time()
+
+    def _format(self, entry: LogEntry) -> str:
+        raise NotImplementedError
+
+    def __call__(self, entry: LogEntry):
+        self._lines.append(self._format(entry))
+        if (len(self._lines) >= self.batch_size or
+                time.time() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Write all buffered lines with a single write and encode call."""
+        if not self._lines:
+            return
+        data = '\n'.join(self._lines)
+        self._lines.clear()
+        with open(self.file_path, 'ab') as f:
+            f.write(data.encode('utf-8') + b'\n')
+        self._last_flush = time.time()
+
+class _JsonFileHandler(_BatchingFileHandler):
+    def _format(self, entry: LogEntry) -> str:
+        # Flat dict from direct attribute access instead of asdict's
+        # reflective field walk and recursive container copies
+        record = {
+            'timestamp': entry.timestamp,
+            'level': entry.level.name,
+            'message': entry.message,
+            'logger_name': entry.logger_name,
+            'module': entry.module,
+            'function': entry.function,
+            'line': entry.line,
+            'thread_id': entry.thread_id,
+            'process_id': entry.process_id,
+            'context': (dict(entry.context_shared, **entry.context)
+                        if entry.context_shared else entry.context),
+            'metrics': entry.metrics,
+            'tags': entry.tags,
+        }
+        if orjson is not None:
+            return orjson.dumps(record, default=str).decode('utf-8')
+        return json.dumps(record, ensure_ascii=False, default=str)
+
+class _StructuredFileHandler(_BatchingFileHandler):
+    # Constant fragments formatted once, not per line
+    _LEVEL_FRAGMENTS = {level: f"level={level.name}" for level in LogLevel}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._logger_fragments: Dict[str, str] = {}
+
+    def _format(self, entry: LogEntry) -> str:
+        timestamp = _format_timestamp(entry.timestamp)
+
+        logger_fragment = self._logger_fragments.get(entry.logger_name)
+        if logger_fragment is None:
+            logger_fragment = f"logger={entry.logger_name}"
+            self._logger_fragments[entry.logger_name] = logger_fragment
+
+        # Build structured line from cached fragments
         parts = [
-            f"timestamp={timestamp}",
-            f"level={entry.level.name}",
-            f"logger={entry.logger_name}",
-            f"message=\"{entry.message}\"",
+            "timestamp=" + timestamp,
+            self._LEVEL_FRAGMENTS[entry.level],
+            logger_fragment,
+            'message="' + entry.message + '"',
         ]
-        
+
         # Add context
+        for k, v in entry.context_shared:
+            parts.append(f"{k}={v}")
         for k, v in entry.context.items():
             parts.append(f"{k}={v}")
-        
+
         # Add tags
         if entry.tags:
             parts.append(f"tags={','.join(entry.tags)}")
-        
-        line = " ".join(parts)
-        
-        with open(file_path, 'a', encoding='utf-8') as f:
-            f.write(line + '\n')
-    
-    return handler
+
+        return " ".join(parts)
+
+def json_file_handler(file_path: str):
+    """Create a batching JSON file handler."""
+    return _JsonFileHandler(file_path)
+
+def structured_file_handler(file_path: str):
+    """Create a batching structured text file handler."""
+    return _StructuredFileHandler(file_path)
 
 class TimingContext:
     """Context manager for timing operations with automatic metrics."""
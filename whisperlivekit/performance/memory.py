@@ -9,19 +9,152 @@ This module provides tools for optimizing memory usage including:
 """
 
 import asyncio
+import ctypes
 import gc
 import logging
+import mmap
+import os
+import sys
 import time
 import weakref
-from collections import deque
+from bisect import bisect_left
+from collections import OrderedDict, deque
 from typing import Dict, List, Optional, Any, Union
 import numpy as np
-from threading import Lock
+from threading import Lock, local
 from dataclasses import dataclass
 import psutil
 
+try:
+    # Optional compiled copy kernels; build with:
+    #   cythonize -i whisperlivekit/performance/_ring_buffer.pyx
+    from ._ring_buffer import ring_read, ring_write
+except ImportError:
+    ring_read = ring_write = None
+
 logger = logging.getLogger(__name__)
 
+# MAP_FIXED is not exposed by the mmap module on every platform
+_MAP_FIXED = getattr(mmap, 'MAP_FIXED', 0x10)
+
+_F32 = np.dtype(np.float32)
+
+
+def _aligned_empty(n: int, dtype: np.dtype, align: int = 64) -> np.ndarray:
+    """Uninitialized 1-D array whose data pointer is align-byte aligned.
+
+    np.empty gives no alignment guarantee; aligning to a cache line lets
+    SIMD loads and stores run at full width on the memcpy-heavy buffer
+    paths. Costs at most `align` bytes of padding per allocation. The
+    returned view keeps the padded allocation alive through .base.
+    """
+    dtype = np.dtype(dtype)
+    pad = align // dtype.itemsize
+    raw = np.empty(n + pad, dtype=dtype)
+    offset = (-raw.ctypes.data % align) // dtype.itemsize
+    return raw[offset:offset + n]
+
+
+def _aligned_zeros(n: int, dtype: np.dtype, align: int = 64) -> np.ndarray:
+    """Zero-filled counterpart of _aligned_empty."""
+    arr = _aligned_empty(n, dtype, align)
+    arr.fill(0)
+    return arr
+
+
+_MADV_HUGEPAGE = 14
+_HUGE_PAGE = 2 * 1024 * 1024
+
+
+def _advise_hugepages(addr: int, nbytes: int):
+    """Hint the kernel to back a large allocation with 2 MiB pages.
+
+    Multi-megabyte audio buffers span hundreds of 4 KiB TLB entries;
+    transparent huge pages cut that pressure on the memcpy-heavy paths.
+    Purely advisory - failures (non-Linux, THP disabled) are ignored.
+    """
+    if sys.platform != 'linux' or nbytes < _HUGE_PAGE:
+        return
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        start = addr & ~(_HUGE_PAGE - 1)
+        libc.madvise(ctypes.c_void_p(start), nbytes + (addr - start),
+                     _MADV_HUGEPAGE)
+    except (OSError, AttributeError):
+        pass
+
+
+class _MirroredBuffer:
+    """The same physical pages mapped twice, back to back.
+
+    In the doubled view any slice [i : i + n) with n <= capacity is
+    contiguous, so ring reads and writes never have to split at the wrap
+    point. Requires memfd_create + MAP_FIXED (Linux); create() returns
+    None when unavailable and callers fall back to split copies.
+    """
+
+    def __init__(self, base: int, fd: int, nbytes: int, array: np.ndarray):
+        self._base = base
+        self._fd = fd
+        self._nbytes = nbytes
+        self.array = array
+
+    @classmethod
+    def create(cls, nbytes: int, dtype: np.dtype) -> Optional['_MirroredBuffer']:
+        """Build a mirrored mapping of nbytes (must be page-aligned)."""
+        if not hasattr(os, 'memfd_create'):
+            return None
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.mmap.restype = ctypes.c_void_p
+            libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                                  ctypes.c_int, ctypes.c_int, ctypes.c_long]
+            libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        except (OSError, AttributeError):
+            return None
+
+        fd = base = None
+        failed = ctypes.c_void_p(-1).value
+        try:
+            fd = os.memfd_create('wlk-audio-ring')
+            os.ftruncate(fd, nbytes)
+            prot = mmap.PROT_READ | mmap.PROT_WRITE
+            # Reserve 2N of address space backed by the fd, then pin a
+            # second mapping of the same fd right after the first copy.
+            base = libc.mmap(None, nbytes * 2, prot, mmap.MAP_SHARED, fd, 0)
+            if base in (None, failed):
+                raise OSError('mmap reservation failed')
+            second = libc.mmap(base + nbytes, nbytes, prot,
+                               mmap.MAP_SHARED | _MAP_FIXED, fd, 0)
+            if second in (None, failed):
+                raise OSError('mirror mmap failed')
+            raw = (ctypes.c_char * (nbytes * 2)).from_address(base)
+            array = np.frombuffer(raw, dtype=dtype)
+            _advise_hugepages(base, nbytes * 2)
+            return cls(base, fd, nbytes, array)
+        except OSError:
+            if base not in (None, failed):
+                libc.munmap(base, nbytes * 2)
+            if fd is not None:
+                os.close(fd)
+            return None
+
+    def close(self):
+        """Unmap both copies and release the backing fd."""
+        if self._base is not None:
+            libc = ctypes.CDLL(None)
+            libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            self.array = None
+            libc.munmap(self._base, self._nbytes * 2)
+            os.close(self._fd)
+            self._base = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
 @dataclass
 class MemoryUsage:
     """Memory usage statistics."""
@@ -35,222 +168,420 @@ class MemoryUsage:
 class CircularAudioBuffer:
     """
     Memory-efficient circular buffer for audio data.
-    
+
     Features:
     - Pre-allocated memory to avoid frequent allocations
     - Automatic resizing with hysteresis
     - Memory-mapped storage for large buffers
-    - Efficient batch operations
+    - Lock-free single-producer / single-consumer operation
+
+    Concurrency contract: at most one thread appends (the producer) and
+    at most one thread reads/consumes (the consumer). The head and tail
+    are derived from two monotonic sample counters, each owned and
+    written by exactly one side; publishing a counter is a plain
+    attribute store, which the GIL makes atomic. The backing store is
+    published as an immutable state tuple that the consumer snapshots
+    and re-checks after copying, and only the producer ever replaces it,
+    so neither side takes a lock on the hot path.
     """
-    
-    def __init__(self, 
+
+    def __init__(self,
                  initial_capacity: int = 320000,  # 20 seconds at 16kHz
                  max_capacity: int = 1600000,     # 100 seconds
-                 dtype: np.dtype = np.float32):
-        
+                 dtype: np.dtype = np.float32,
+                 storage_dtype: Optional[np.dtype] = None,
+                 pool: Optional['MemoryPool'] = None):
+
         self.max_capacity = max_capacity
-        self.dtype = dtype
-        self._lock = Lock()
-        
-        # Pre-allocate buffer
-        self._buffer = np.zeros(initial_capacity, dtype=dtype)
-        self._capacity = initial_capacity
-        self._size = 0
-        self._head = 0
-        self._tail = 0
-        
+        self.dtype = np.dtype(dtype)
+        # Samples can be held quantized (int16 transport is half the
+        # bytes of float32) and dequantized on the way out; microphone
+        # input is natively int16, so those appends store zero-copy.
+        if storage_dtype is None:
+            self.storage_dtype = self.dtype
+        else:
+            self.storage_dtype = np.dtype(storage_dtype)
+        self._quantized = self.storage_dtype != self.dtype
+        if self._quantized and (self.dtype != _F32
+                                or self.storage_dtype != np.dtype(np.int16)):
+            raise ValueError(
+                "quantized storage only supports float32 samples in int16")
+        self._pool = pool
+
+        # Backing store as one immutable (buffer, mirror, capacity)
+        # tuple: readers snapshot it with a single attribute load.
+        self._state = self._allocate(initial_capacity)
+        self._capacity = self._state[2]
+
+        # Monotonic sample counters: _write_pos is producer-owned,
+        # _read_pos is consumer-owned. size/head/tail derive from them,
+        # so neither side ever writes a field the other side owns.
+        self._write_pos = 0
+        self._read_pos = 0
+
         # Statistics
         self._total_writes = 0
         self._total_reads = 0
         self._resize_count = 0
-        
+
+        # Optional (old_bytes, new_bytes) hook so an owner can keep a
+        # running footprint total without polling every buffer
+        self.on_resize = None
+
+    def _allocate(self, capacity: int, zero: bool = True) -> tuple:
+        """Build a (buffer, mirror, capacity) backing store.
+
+        Mirrored capacities are rounded up to a whole number of pages (an
+        mmap requirement); the fallback keeps the requested size. Callers
+        about to overwrite the used prefix pass zero=False to skip the
+        fallback's zero-fill (fresh mmap pages are zeroed by the kernel
+        either way). Old mirror mappings are unmapped by
+        _MirroredBuffer.__del__ once the last snapshot referencing them
+        is dropped, so a consumer mid-copy can never touch freed pages.
+        """
+        itemsize = self.storage_dtype.itemsize
+        nbytes = -(-capacity * itemsize // mmap.PAGESIZE) * mmap.PAGESIZE
+        mirror = _MirroredBuffer.create(nbytes, self.storage_dtype)
+        if mirror is not None:
+            # The buffer is the doubled view; slices starting below
+            # capacity never need to split at the wrap point.
+            return (mirror.array, mirror, nbytes // itemsize)
+        if zero:
+            buffer = _aligned_zeros(capacity, self.storage_dtype)
+        else:
+            buffer = _aligned_empty(capacity, self.storage_dtype)
+        _advise_hugepages(buffer.ctypes.data, buffer.nbytes)
+        return (buffer, None, capacity)
+
     def append(self, data: np.ndarray) -> bool:
         """
-        Append data to the buffer.
-        
+        Append data to the buffer. Producer side only.
+
         Returns:
             bool: True if successful, False if buffer is full
         """
-        with self._lock:
-            data_size = len(data)
-            
-            # Check if we need to resize
-            if self._size + data_size > self._capacity:
-                if not self._resize(self._size + data_size):
-                    return False
-            
-            # Handle wrapping
-            if self._tail + data_size <= self._capacity:
-                # No wrapping needed
-                self._buffer[self._tail:self._tail + data_size] = data
+        data_size = len(data)
+        if data_size == 0:
+            return True
+
+        # Hoist the per-call attribute loads once; at ~100 appends/s per
+        # stream these dict lookups add up.
+        storage_dtype = self.storage_dtype
+        if data.dtype != storage_dtype:
+            if self._quantized:
+                # Quantize float samples for transport; int16 input is
+                # stored as-is with no copy here
+                data = np.multiply(data, 32767.0).astype(storage_dtype)
             else:
-                # Split across wrap boundary
-                first_part = self._capacity - self._tail
-                self._buffer[self._tail:] = data[:first_part]
-                self._buffer[:data_size - first_part] = data[first_part:]
-            
-            self._tail = (self._tail + data_size) % self._capacity
-            self._size += data_size
-            self._total_writes += 1
-            
+                # Normalize once so every copy below is cast-free
+                data = data.astype(storage_dtype)
+
+        write_pos = self._write_pos
+        # A stale _read_pos only over-estimates the fill level, which is
+        # the safe direction for both checks below.
+        size = write_pos - self._read_pos
+        capacity = self._capacity
+
+        # Check if we need to resize
+        if size + data_size > capacity:
+            if not self._resize(size + data_size):
+                return False
+        # Auto-shrink if buffer is mostly empty. This lives on the
+        # producer side so that only one thread ever swaps the store.
+        elif size + data_size < capacity // 4 and capacity > 320000:
+            self._resize(max(320000, (size + data_size) * 2))
+
+        buffer, mirror, capacity = self._state
+        tail = write_pos % capacity
+
+        # Handle wrapping. casting='no' skips the dtype-promotion check
+        # in ndarray.__setitem__; dtypes match by construction above.
+        if mirror is not None:
+            # Doubled view: one contiguous store, even across the wrap
+            np.copyto(buffer[tail:tail + data_size], data, casting='no')
+        elif (ring_write is not None and storage_dtype == _F32
+              and data.flags.c_contiguous):
+            # Compiled kernel: GIL-free memcpy, wrap split handled in C
+            ring_write(buffer, capacity, tail, data)
+        elif tail + data_size <= capacity:
+            # No wrapping needed
+            np.copyto(buffer[tail:tail + data_size], data, casting='no')
+        else:
+            # Split across wrap boundary
+            first_part = capacity - tail
+            np.copyto(buffer[tail:capacity], data[:first_part], casting='no')
+            np.copyto(buffer[:data_size - first_part], data[first_part:], casting='no')
+
+        # Publish last: the consumer never sees samples beyond _write_pos
+        self._write_pos = write_pos + data_size
+        self._total_writes += 1
+
+        return True
+
+    def append_many(self, chunks: List[np.ndarray]) -> bool:
+        """
+        Append several chunks as a single write. Producer side only.
+
+        The websocket read loop often has several 10-20ms frames ready
+        per tick; staging them into one array amortizes the per-append
+        overhead (resize check, wrap handling, counter publish) across
+        the whole batch.
+
+        Args:
+            chunks: Sequence of 1-D arrays of the buffer's dtype
+
+        Returns:
+            bool: True if successful, False if buffer is full
+        """
+        if not chunks:
             return True
-    
-    def read(self, size: int) -> Optional[np.ndarray]:
+        if len(chunks) == 1:
+            return self.append(chunks[0])
+
+        total = 0
+        for chunk in chunks:
+            total += len(chunk)
+
+        if self._pool is not None:
+            staging = self._pool.get_array(total, zero=False)
+        else:
+            staging = np.empty(total, dtype=self.dtype)
+
+        offset = 0
+        for chunk in chunks:
+            n = len(chunk)
+            staging[offset:offset + n] = chunk
+            offset += n
+
+        ok = self.append(staging)
+        if self._pool is not None:
+            self._pool.return_array(staging)
+        return ok
+
+    def read(self, size: int, out: Optional[np.ndarray] = None,
+             raw: bool = False) -> Optional[np.ndarray]:
         """
-        Read data from the buffer without removing it.
-        
+        Read data from the buffer without removing it. Consumer side.
+
         Args:
             size: Number of samples to read
-            
+            out: Optional preallocated destination of at least `size`
+                 samples; avoids allocating a fresh array per call
+            raw: Return samples in the storage dtype without dequantizing
+
         Returns:
             numpy array or None if not enough data
         """
-        with self._lock:
-            if size > self._size:
+        result = self._copy_from_head(size, 0, out, raw)
+        if result is not None:
+            self._total_reads += 1
+        return result
+
+    def _out_array(self, size: int, out: Optional[np.ndarray], dtype: np.dtype) -> np.ndarray:
+        """Destination for a copy-out: caller's buffer, pool, or fresh."""
+        if out is not None:
+            if __debug__:
+                assert out.dtype == dtype and out.flags.c_contiguous
+            return out[:size]
+        if self._pool is not None and dtype == self._pool.dtype:
+            return self._pool.get_array(size, zero=False)
+        # np.empty, not zeros: every element is overwritten below
+        return np.empty(size, dtype=dtype)
+
+    def _copy_from_head(self, size: int, offset: int, out: Optional[np.ndarray],
+                        raw: bool = False) -> Optional[np.ndarray]:
+        """Copy `size` samples starting `offset` past the head.
+
+        Snapshots the state tuple, copies, then re-checks the snapshot:
+        if the producer published a resize mid-copy, the old store is
+        still alive (held by the snapshot) and its data unchanged, but
+        we copy again from the fresh store to keep it simple. The
+        monotonic counters stay valid across a resize because _resize
+        places the data congruent with them.
+        """
+        storage_dtype = self.storage_dtype
+        dequantize = self._quantized and not raw
+        while True:
+            state = self._state
+            buffer, mirror, capacity = state
+            read_pos = self._read_pos
+            if offset + size > self._write_pos - read_pos:
                 return None
-            
-            result = np.zeros(size, dtype=self.dtype)
-            
-            if self._head + size <= self._capacity:
+
+            start_pos = (read_pos + offset) % capacity
+            if dequantize:
+                # Stage the raw samples, dequantize below once the
+                # snapshot is confirmed
+                result = np.empty(size, dtype=storage_dtype)
+            else:
+                result = self._out_array(size, out, storage_dtype)
+
+            if mirror is not None:
+                # Doubled view: one contiguous copy, even across the wrap
+                np.copyto(result, buffer[start_pos:start_pos + size], casting='no')
+            elif (ring_read is not None and storage_dtype == _F32
+                  and result.flags.c_contiguous):
+                # Compiled kernel: GIL-free memcpy, wrap split handled in C
+                ring_read(buffer, capacity, start_pos, result)
+            elif start_pos + size <= capacity:
                 # No wrapping
-                result[:] = self._buffer[self._head:self._head + size]
+                np.copyto(result, buffer[start_pos:start_pos + size], casting='no')
             else:
                 # Handle wrapping
-                first_part = self._capacity - self._head
-                result[:first_part] = self._buffer[self._head:]
-                result[first_part:] = self._buffer[:size - first_part]
-            
-            self._total_reads += 1
-            return result
-    
-    def consume(self, size: int) -> Optional[np.ndarray]:
+                first_part = capacity - start_pos
+                np.copyto(result[:first_part], buffer[start_pos:capacity], casting='no')
+                np.copyto(result[first_part:], buffer[:size - first_part], casting='no')
+
+            if self._state is state:
+                if dequantize:
+                    # Dequantize on the way out
+                    floats = self._out_array(size, out, self.dtype)
+                    np.multiply(result, 1.0 / 32767.0, out=floats)
+                    return floats
+                return result
+
+    def consume(self, size: int, out: Optional[np.ndarray] = None,
+                raw: bool = False) -> Optional[np.ndarray]:
         """
-        Read and remove data from the buffer.
-        
+        Read and remove data from the buffer. Consumer side.
+
         Args:
             size: Number of samples to consume
-            
+            out: Optional preallocated destination of at least `size` samples
+            raw: Return samples in the storage dtype without dequantizing
+
         Returns:
             numpy array or None if not enough data
         """
-        with self._lock:
-            result = self.read(size)
-            if result is not None:
-                self._head = (self._head + size) % self._capacity
-                self._size -= size
-                
-                # Auto-shrink if buffer is mostly empty
-                if self._size < self._capacity // 4 and self._capacity > 320000:
-                    self._resize(max(320000, self._size * 2))
-            
-            return result
-    
-    def peek(self, size: int, offset: int = 0) -> Optional[np.ndarray]:
+        result = self._copy_from_head(size, 0, out, raw)
+        if result is not None:
+            self._read_pos += size
+            self._total_reads += 1
+        return result
+
+    def peek(self, size: int, offset: int = 0, out: Optional[np.ndarray] = None,
+             raw: bool = False) -> Optional[np.ndarray]:
         """
-        Peek at data without consuming it.
-        
+        Peek at data without consuming it. Consumer side.
+
         Args:
             size: Number of samples to peek at
             offset: Offset from head
-            
+            out: Optional preallocated destination of at least `size` samples
+            raw: Return samples in the storage dtype without dequantizing
+
         Returns:
             numpy array or None if not enough data
         """
-        with self._lock:
-            if offset + size > self._size:
-                return None
-            
-            start_pos = (self._head + offset) % self._capacity
-            result = np.zeros(size, dtype=self.dtype)
-            
-            if start_pos + size <= self._capacity:
-                result[:] = self._buffer[start_pos:start_pos + size]
-            else:
-                first_part = self._capacity - start_pos
-                result[:first_part] = self._buffer[start_pos:]
-                result[first_part:] = self._buffer[:size - first_part]
-            
-            return result
-    
+        return self._copy_from_head(size, offset, out, raw)
+
     def clear(self):
-        """Clear the buffer."""
-        with self._lock:
-            self._size = 0
-            self._head = 0
-            self._tail = 0
-    
+        """Clear the buffer. Not safe against a concurrent append."""
+        self._read_pos = self._write_pos
+
     def _resize(self, new_capacity: int) -> bool:
         """
-        Resize the buffer.
-        
+        Resize the buffer. Runs on the producer side only.
+
         Args:
             new_capacity: New capacity in samples
-            
+
         Returns:
             bool: True if resize successful
         """
         if new_capacity > self.max_capacity:
             logger.warning(f"Cannot resize buffer beyond max capacity: {self.max_capacity}")
             return False
-        
-        # Round up to nearest power of 2 for better memory alignment
-        new_capacity = 2 ** int(np.ceil(np.log2(new_capacity)))
-        
+
+        # Amortized doubling on growth: at least 2x the current capacity,
+        # capped at max_capacity. Cheaper than the old power-of-2 rounding
+        # (no FP log2/ceil) and never over-allocates by up to 2x past the
+        # request. Shrinks go straight to the requested size.
+        if new_capacity > self._capacity:
+            new_capacity = min(max(self._capacity * 2, new_capacity), self.max_capacity)
+
         if new_capacity == self._capacity:
             return True
-        
+
         logger.debug(f"Resizing audio buffer from {self._capacity} to {new_capacity}")
-        
-        # Create new buffer
-        new_buffer = np.zeros(new_capacity, dtype=self.dtype)
-        
-        # Copy existing data
-        if self._size > 0:
-            data = self.read(self._size)
-            if data is not None:
-                new_buffer[:self._size] = data
-        
-        # Update buffer
-        self._buffer = new_buffer
+
+        old_buffer, old_mirror, old_capacity = self._state
+        read_pos = self._read_pos
+        size = self._write_pos - read_pos
+
+        new_state = self._allocate(new_capacity, zero=False)
+        new_buffer, new_mirror, new_capacity = new_state
+
+        # Copy straight from the old store (no temp, no zero-init),
+        # placing the data congruent with the monotonic counters
+        # (destination index read_pos % new_capacity) so head and tail
+        # derived from them stay valid without rebasing either counter.
+        copied = 0
+        while copied < size:
+            src = (read_pos + copied) % old_capacity
+            dst = (read_pos + copied) % new_capacity
+            n = size - copied
+            if old_mirror is None:
+                n = min(n, old_capacity - src)
+            if new_mirror is None:
+                n = min(n, new_capacity - dst)
+            np.copyto(new_buffer[dst:dst + n], old_buffer[src:src + n], casting='no')
+            copied += n
+
+        # Publish only after the copy; consumers mid-copy on the old
+        # store re-check their snapshot and redo from the new one.
+        self._state = new_state
         self._capacity = new_capacity
-        self._head = 0
-        self._tail = self._size
         self._resize_count += 1
-        
+
+        if self.on_resize is not None:
+            itemsize = self.storage_dtype.itemsize
+            self.on_resize(old_capacity * itemsize, new_capacity * itemsize)
+
         return True
-    
+
     @property
     def size(self) -> int:
         """Current size of data in buffer."""
-        return self._size
-    
+        # Read _read_pos first: _write_pos only grows, so this order
+        # can never produce a negative size.
+        read_pos = self._read_pos
+        return self._write_pos - read_pos
+
     @property
     def capacity(self) -> int:
         """Current capacity of buffer."""
         return self._capacity
-    
+
     @property
     def available_space(self) -> int:
         """Available space in buffer."""
-        return self._capacity - self._size
-    
+        return self._capacity - self.size
+
     @property
     def memory_usage_mb(self) -> float:
         """Memory usage in MB."""
-        return (self._capacity * self.dtype.itemsize) / (1024 * 1024)
-    
+        return (self._capacity * self.storage_dtype.itemsize) / (1024 * 1024)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get buffer statistics."""
+        size = self.size
         return {
-            'size': self._size,
+            'size': size,
             'capacity': self._capacity,
-            'utilization_percent': (self._size / self._capacity) * 100,
+            'utilization_percent': (size / self._capacity) * 100,
             'memory_mb': self.memory_usage_mb,
             'total_writes': self._total_writes,
             'total_reads': self._total_reads,
             'resize_count': self._resize_count,
         }
 
+
+class _PoolDict(dict):
+    """Plain dict that supports weak references (for the tls registry)."""
+    __slots__ = ('__weakref__',)
+
+
 class MemoryPool:
     """
     Memory pool for efficient allocation of numpy arrays.
@@ -277,59 +608,83 @@ class MemoryPool:
                 32000,   # 2s at 16kHz
             ]
         
-        self.pool_sizes = sorted(pool_sizes)
+        self.pool_sizes = tuple(sorted(pool_sizes))
         self.max_arrays_per_size = max_arrays_per_size
-        self.dtype = dtype
-        
-        # Initialize pools
-        self._pools: Dict[int, deque] = {}
-        self._locks: Dict[int, Lock] = {}
+        # normalize type objects like np.float32 to a dtype instance so
+        # self.dtype.itemsize works
+        self.dtype = np.dtype(dtype)
         
-        for size in pool_sizes:
-            self._pools[size] = deque()
-            self._locks[size] = Lock()
-            
+        # Per-thread pools: the hot path pops and pushes without taking
+        # any lock. A single shared overflow pool holds the pre-allocated
+        # arrays and catches cross-thread donations.
+        self._tls = local()
+        self._tls_registry: List[weakref.ref] = []
+        self._shared: Dict[int, deque] = {}
+        self._shared_lock = Lock()
+
+        for size in self.pool_sizes:
+            shared = deque()
             # Pre-allocate some arrays
             for _ in range(min(3, max_arrays_per_size)):
-                array = np.zeros(size, dtype=dtype)
-                self._pools[size].append(array)
-        
+                shared.append(_aligned_zeros(size, dtype))
+            self._shared[size] = shared
+
         # Statistics
         self._allocations = 0
         self._hits = 0
         self._misses = 0
+
+    def _thread_pools(self) -> Dict[int, deque]:
+        """Per-thread size->deque map, created lazily on first use."""
+        pools = getattr(self._tls, 'pools', None)
+        if pools is None:
+            pools = _PoolDict((s, deque()) for s in self.pool_sizes)
+            self._tls.pools = pools
+            with self._shared_lock:
+                self._tls_registry.append(weakref.ref(pools))
+        return pools
         
-    def get_array(self, size: int) -> np.ndarray:
+    def get_array(self, size: int, zero: bool = True) -> np.ndarray:
         """
         Get an array from the pool or allocate a new one.
-        
+
         Args:
             size: Required array size
-            
+            zero: Clear the array before handing it out; callers that
+                  overwrite every element pass False to skip a full
+                  streaming write over the buffer
+
         Returns:
             numpy array of the requested size
         """
         self._allocations += 1
-        
+
         # Find best fit pool
-        pool_size = None
-        for ps in self.pool_sizes:
-            if ps >= size:
-                pool_size = ps
-                break
-        
-        if pool_size is not None and pool_size in self._pools:
-            with self._locks[pool_size]:
-                if self._pools[pool_size]:
-                    array = self._pools[pool_size].popleft()
-                    self._hits += 1
-                    # Clear the array
+        sizes = self.pool_sizes
+        idx = bisect_left(sizes, size)
+        pool_size = sizes[idx] if idx < len(sizes) else None
+
+        if pool_size is not None:
+            array = None
+            pool = self._thread_pools()[pool_size]
+            if pool:
+                array = pool.pop()
+            else:
+                shared = self._shared[pool_size]
+                with self._shared_lock:
+                    if shared:
+                        array = shared.popleft()
+            if array is not None:
+                self._hits += 1
+                if zero:
                     array.fill(0)
-                    return array[:size] if size < pool_size else array
-        
+                return array[:size] if size < pool_size else array
+
         # Pool miss - allocate new array
         self._misses += 1
-        return np.zeros(size, dtype=self.dtype)
+        if zero:
+            return _aligned_zeros(size, self.dtype)
+        return _aligned_empty(size, self.dtype)
     
     def return_array(self, array: np.ndarray):
         """
@@ -339,30 +694,56 @@ class MemoryPool:
             array: Array to return to pool
         """
         size = len(array)
-        
+
         # Find matching pool
-        pool_size = None
-        for ps in self.pool_sizes:
-            if ps == size:
-                pool_size = ps
-                break
-        
-        if pool_size is not None and pool_size in self._pools:
-            with self._locks[pool_size]:
-                if len(self._pools[pool_size]) < self.max_arrays_per_size:
-                    # Make sure it's contiguous
-                    if not array.flags.c_contiguous:
-                        array = np.ascontiguousarray(array)
-                    self._pools[pool_size].append(array)
+        sizes = self.pool_sizes
+        idx = bisect_left(sizes, size)
+        if idx < len(sizes) and sizes[idx] == size:
+            pool_size = sizes[idx]
+        elif idx > 0:
+            # Non-pool size (e.g. a resize product): trim to the nearest
+            # smaller pool size so later requests can still reuse it
+            # instead of missing and allocating fresh
+            pool_size = sizes[idx - 1]
+            array = array[:pool_size]
+        else:
+            return
+
+        # Make sure it's contiguous
+        if not array.flags.c_contiguous:
+            array = np.ascontiguousarray(array)
+
+        pool = self._thread_pools()[pool_size]
+        if len(pool) < self.max_arrays_per_size:
+            pool.append(array)
+            return
+
+        # Local pool is full - donate to the shared overflow pool
+        shared = self._shared[pool_size]
+        with self._shared_lock:
+            if len(shared) < self.max_arrays_per_size:
+                shared.append(array)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get pool statistics."""
         pool_stats = {}
         total_arrays = 0
         total_memory_mb = 0
-        
-        for size, pool in self._pools.items():
-            count = len(pool)
+
+        counts = dict.fromkeys(self.pool_sizes, 0)
+        with self._shared_lock:
+            for size, pool in self._shared.items():
+                counts[size] += len(pool)
+            self._tls_registry[:] = [r for r in self._tls_registry if r() is not None]
+            refs = list(self._tls_registry)
+        for ref in refs:
+            pools = ref()
+            if pools is None:
+                continue
+            for size, pool in pools.items():
+                counts[size] += len(pool)
+
+        for size, count in counts.items():
             memory_mb = (count * size * self.dtype.itemsize) / (1024 * 1024)
             pool_stats[f'size_{size}'] = {
                 'count': count,
@@ -397,76 +778,81 @@ class SmartCache:
         self.max_memory_mb = max_memory_mb
         self.cleanup_threshold = cleanup_threshold
         
-        self._cache: Dict[str, Any] = {}
-        self._access_order: deque = deque()
+        # One OrderedDict in LRU order, entries are (value, size_mb):
+        # hits are an O(1) move_to_end, eviction an O(1) popitem.
+        self._cache: 'OrderedDict[str, tuple]' = OrderedDict()
         self._memory_usage = 0
+        self._insert_count = 0
         self._lock = Lock()
-        
-        # Weak references for automatic cleanup
-        self._weak_refs: Dict[str, weakref.ref] = {}
-        
+
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache."""
         with self._lock:
-            if key in self._cache:
+            entry = self._cache.get(key)
+            if entry is not None:
                 # Move to end (most recently used)
-                self._access_order.remove(key)
-                self._access_order.append(key)
-                return self._cache[key]
+                self._cache.move_to_end(key)
+                return entry[0]
         return None
-    
+
     def put(self, key: str, value: Any, size_mb: float = None):
         """Put item in cache."""
         if size_mb is None:
             size_mb = self._estimate_size(value)
-        
+
         with self._lock:
             # Remove if already exists
             if key in self._cache:
-                self.remove(key)
-            
+                self._remove_locked(key)
+
             # Check if we need to make space
-            while (len(self._cache) >= self.max_size or 
+            while (len(self._cache) >= self.max_size or
                    self._memory_usage + size_mb > self.max_memory_mb):
                 if not self._evict_oldest():
                     break
-            
-            # Add new item
-            self._cache[key] = value
-            self._access_order.append(key)
+
+            # Add new item (newest position)
+            self._cache[key] = (value, size_mb)
             self._memory_usage += size_mb
-            
-            # Set up weak reference for automatic cleanup
-            def cleanup_callback(ref):
-                with self._lock:
-                    if key in self._weak_refs and self._weak_refs[key] is ref:
-                        self.remove(key)
-            
-            self._weak_refs[key] = weakref.ref(value, cleanup_callback)
-    
+
+            # Occasionally sweep out dead weak references
+            self._insert_count += 1
+            if self._insert_count % 64 == 0:
+                self._purge_dead()
+
     def remove(self, key: str) -> bool:
         """Remove item from cache."""
-        if key in self._cache:
-            del self._cache[key]
-            self._access_order.remove(key)
-            if key in self._weak_refs:
-                del self._weak_refs[key]
-            return True
-        return False
-    
+        return self._remove_locked(key)
+
+    def _remove_locked(self, key: str) -> bool:
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._memory_usage -= entry[1]
+        return True
+
+    def _purge_dead(self):
+        """Drop entries whose cached value is a dead weak reference.
+
+        Caller holds the lock. This replaces the old per-entry weakref
+        callback, which could fire from arbitrary threads during GC and
+        re-acquire the cache lock while it was already held.
+        """
+        dead = [key for key, entry in self._cache.items()
+                if isinstance(entry[0], weakref.ref) and entry[0]() is None]
+        for key in dead:
+            self._remove_locked(key)
+
     def _evict_oldest(self) -> bool:
         """Evict the oldest item from cache."""
-        if not self._access_order:
+        if not self._cache:
             return False
-        
-        oldest_key = self._access_order.popleft()
-        if oldest_key in self._cache:
-            del self._cache[oldest_key]
-            if oldest_key in self._weak_refs:
-                del self._weak_refs[oldest_key]
-        
+
+        _, (_, size_mb) = self._cache.popitem(last=False)
+        self._memory_usage -= size_mb
+
         return True
-    
+
     def _estimate_size(self, obj: Any) -> float:
         """Estimate object size in MB."""
         if isinstance(obj, np.ndarray):
@@ -480,8 +866,6 @@ class SmartCache:
         """Clear all cached items."""
         with self._lock:
             self._cache.clear()
-            self._access_order.clear()
-            self._weak_refs.clear()
             self._memory_usage = 0
     
     def get_stats(self) -> Dict[str, Any]:
@@ -494,6 +878,21 @@ class SmartCache:
             'utilization_percent': (len(self._cache) / self.max_size) * 100
         }
 
+# Shared, time-bounded snapshot of psutil.virtual_memory(): reading
+# /proc/meminfo costs a syscall plus string parsing, which is wasteful
+# on every optimizer heartbeat across all instances.
+_mem_cache = {'ts': 0.0, 'val': None}
+
+
+def _cached_vmem(max_age: float = 1.0):
+    """psutil.virtual_memory(), refreshed at most once per max_age seconds."""
+    now = time.monotonic()
+    if now - _mem_cache['ts'] > max_age or _mem_cache['val'] is None:
+        _mem_cache['val'] = psutil.virtual_memory()
+        _mem_cache['ts'] = now
+    return _mem_cache['val']
+
+
 class MemoryOptimizer:
     """
     Advanced memory optimization for WhisperLiveKit.
@@ -507,27 +906,42 @@ class MemoryOptimizer:
     
     def __init__(self):
         self.memory_pools = MemoryPool()
-        self.audio_buffers = {}
+        # Kept in last-access order so that the stalest buffers are
+        # always at the front; see _cleanup_old_buffers.
+        self.audio_buffers: 'OrderedDict[str, tuple]' = OrderedDict()
         self.gc_enabled = True
-        self.last_gc_time = time.time()
+        self.last_gc_time = time.monotonic()
         self.gc_interval = 10.0  # seconds
         self.memory_threshold_mb = 512  # MB
-        
+        self._gc_tick = 0
+        # Running footprint of all live audio buffers, maintained on
+        # add/resize/release so stats never rescan the buffer table
+        self._total_buffer_bytes = 0
+        self._gc_threshold = gc.get_threshold()
+
     def optimize_memory_usage(self):
         """Perform memory optimization tasks."""
-        current_time = time.time()
-        
-        # Periodic garbage collection
-        if (self.gc_enabled and 
+        current_time = time.monotonic()
+
+        # Periodic garbage collection: a gen-0 sweep runs in well under
+        # a millisecond and catches most short-lived garbage, while a
+        # full collect() walks every live object and can stall the event
+        # loop for tens of milliseconds. Sweep the old generations only
+        # on every 10th tick; _emergency_cleanup still collects fully.
+        if (self.gc_enabled and
             current_time - self.last_gc_time > self.gc_interval):
-            
-            collected = gc.collect()
+
+            self._gc_tick += 1
+            if self._gc_tick % 10 == 0:
+                collected = gc.collect(2)
+            else:
+                collected = gc.collect(0)
             if collected > 0:
                 logger.debug(f"Garbage collection freed {collected} objects")
             self.last_gc_time = current_time
         
         # Check memory pressure
-        memory_usage = psutil.virtual_memory()
+        memory_usage = _cached_vmem()
         if memory_usage.percent > 85.0:
             logger.warning(f"High memory usage: {memory_usage.percent:.1f}%")
             self._emergency_cleanup()
@@ -548,44 +962,59 @@ class MemoryOptimizer:
         self._cleanup_old_buffers()
     
     def _cleanup_old_buffers(self):
-        """Clean up old audio buffers."""
-        current_time = time.time()
-        old_buffers = []
-        
-        for buffer_id, (buffer, timestamp) in self.audio_buffers.items():
-            if current_time - timestamp > 300:  # 5 minutes old
-                old_buffers.append(buffer_id)
-        
-        for buffer_id in old_buffers:
-            del self.audio_buffers[buffer_id]
-            
-        if old_buffers:
-            logger.debug(f"Cleaned up {len(old_buffers)} old audio buffers")
+        """Clean up audio buffers idle for more than 5 minutes.
+
+        audio_buffers is ordered by last access, so stale entries sit at
+        the front and eviction stops at the first fresh one: O(evicted)
+        instead of a scan over every live stream.
+        """
+        cutoff = time.monotonic() - 300
+        evicted = 0
+
+        while self.audio_buffers:
+            _, (_, timestamp) = next(iter(self.audio_buffers.items()))
+            if timestamp >= cutoff:
+                break
+            _, (buffer, _) = self.audio_buffers.popitem(last=False)
+            self._total_buffer_bytes -= buffer.capacity * buffer.storage_dtype.itemsize
+            evicted += 1
+
+        if evicted:
+            logger.debug(f"Cleaned up {evicted} old audio buffers")
     
     def get_audio_buffer(self, buffer_id: str, size: int) -> CircularAudioBuffer:
         """Get or create an audio buffer."""
-        if buffer_id not in self.audio_buffers:
-            buffer = CircularAudioBuffer(initial_capacity=size)
-            self.audio_buffers[buffer_id] = (buffer, time.time())
+        entry = self.audio_buffers.get(buffer_id)
+        if entry is None:
+            buffer = CircularAudioBuffer(initial_capacity=size, pool=self.memory_pools)
+            buffer.on_resize = self._buffer_resized
+            self._total_buffer_bytes += buffer.capacity * buffer.storage_dtype.itemsize
         else:
-            buffer, _ = self.audio_buffers[buffer_id]
-            # Update timestamp
-            self.audio_buffers[buffer_id] = (buffer, time.time())
-        
+            buffer = entry[0]
+        # Update timestamp and move to the fresh end of the access order
+        self.audio_buffers[buffer_id] = (buffer, time.monotonic())
+        self.audio_buffers.move_to_end(buffer_id)
+
         return buffer
     
+    def _buffer_resized(self, old_bytes: int, new_bytes: int):
+        """Buffer resize hook: keep the running footprint total current."""
+        self._total_buffer_bytes += new_bytes - old_bytes
+
     def release_audio_buffer(self, buffer_id: str):
         """Release an audio buffer."""
-        if buffer_id in self.audio_buffers:
-            del self.audio_buffers[buffer_id]
+        entry = self.audio_buffers.pop(buffer_id, None)
+        if entry is not None:
+            buffer = entry[0]
+            self._total_buffer_bytes -= buffer.capacity * buffer.storage_dtype.itemsize
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get comprehensive memory statistics."""
-        memory = psutil.virtual_memory()
+        memory = _cached_vmem()
         
         buffer_stats = {
             'count': len(self.audio_buffers),
-            'total_memory_mb': sum(buf.memory_usage_mb for buf, _ in self.audio_buffers.values())
+            'total_memory_mb': self._total_buffer_bytes / (1024 * 1024)
         }
         
         return {
@@ -599,7 +1028,7 @@ class MemoryOptimizer:
             'memory_pools': self.memory_pools.get_stats(),
             'gc_stats': {
                 'collections': gc.get_count(),
-                'threshold': gc.get_threshold()
+                'threshold': self._gc_threshold
             }
         }
 
@@ -11,15 +11,75 @@ This module provides:
 import asyncio
 import json
 import logging
+import os
 import time
 import zlib
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any, Union, Callable
 from enum import Enum
 import struct
+from collections import deque
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
 
 logger = logging.getLogger(__name__)
 
+# Codec ids carried in bits 1-2 of the packet flags byte
+_CODEC_NONE = 0
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+
+# zstd levels roughly matching the zlib speed/ratio tiers
+_ZSTD_LEVELS = {1: 1, 6: 3, 9: 10}
+
+# Payload codec ids carried in bits 4-5 of the packet flags byte
+_PAYLOAD_JSON = 0
+_PAYLOAD_MSGPACK = 1
+_PAYLOAD_CBOR = 2
+
+# Packet header: message type, flags, payload length. Pre-compiled so
+# the pack/unpack hot path skips format-string parsing per packet.
+_HDR = struct.Struct('>BBI')
+
+# Batch frame layout: count + timestamp header, then one length prefix
+# per message payload
+_BATCH_HDR = struct.Struct('>Id')
+_BATCH_LEN = struct.Struct('>I')
+
+
+if orjson is not None:
+    # orjson serializes straight to UTF-8 bytes in C, several times
+    # faster than the stdlib json encoder for the dict shapes we send.
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
 class CompressionLevel(Enum):
     """Compression levels for different use cases."""
     NONE = 0        # No compression
@@ -43,8 +103,20 @@ class CompressionStats:
     compressed_messages: int = 0
     original_bytes: int = 0
     compressed_bytes: int = 0
-    compression_time_ms: float = 0
-    decompression_time_ms: float = 0
+    # integer nanosecond accumulators; float ms additions lose
+    # precision once the totals grow and cost a division per sample
+    compression_time_ns: int = 0
+    decompression_time_ns: int = 0
+    
+    @property
+    def compression_time_ms(self) -> float:
+        """Total compression time in milliseconds."""
+        return self.compression_time_ns / 1e6
+    
+    @property
+    def decompression_time_ms(self) -> float:
+        """Total decompression time in milliseconds."""
+        return self.decompression_time_ns / 1e6
     
     @property
     def compression_ratio(self) -> float:
@@ -67,34 +139,143 @@ class AdaptiveCompressor:
     - Threshold-based compression decisions
     """
     
-    def __init__(self, 
+    def __init__(self,
                  min_compress_size: int = 100,
                  compression_threshold_ratio: float = 0.8,
-                 performance_window: int = 100):
-        
+                 performance_window: int = 100,
+                 backend: str = 'zstd',
+                 dict_dir: Optional[str] = None,
+                 payload_codec: str = 'json',
+                 stats_enabled: bool = True):
+
         self.min_compress_size = min_compress_size
         self.compression_threshold_ratio = compression_threshold_ratio
         self.performance_window = performance_window
-        
-        # Compression levels per message type
-        self._compression_levels = {
-            MessageType.TRANSCRIPTION_RESULT: CompressionLevel.BALANCED,
-            MessageType.AUDIO_DATA: CompressionLevel.FAST,
-            MessageType.STATUS_UPDATE: CompressionLevel.FAST,
-            MessageType.ERROR_MESSAGE: CompressionLevel.NONE,
-            MessageType.HEARTBEAT: CompressionLevel.NONE,
-            MessageType.BATCH_UPDATE: CompressionLevel.BEST
-        }
-        
-        # Statistics
+
+        # zstd compresses JSON several times faster than zlib at the
+        # same or better ratio; fall back to zlib when the zstandard
+        # package is unavailable. Contexts are built once and reused -
+        # building a compressor per call would negate the win.
+        self.backend = backend if backend == 'zstd' and zstandard is not None else 'zlib'
+        if zstandard is not None:
+            self._zstd_compressors = {
+                zlib_level: zstandard.ZstdCompressor(level=zstd_level, threads=0)
+                for zlib_level, zstd_level in _ZSTD_LEVELS.items()
+            }
+            self._zstd_decompressor = zstandard.ZstdDecompressor()
+        else:
+            self._zstd_compressors = {}
+            self._zstd_decompressor = None
+        
+        # Trained zstd dictionaries make even tiny per-type messages
+        # compressible, since the shared JSON key scaffolding lives in
+        # the dictionary instead of every packet. dict_dir holds one
+        # <message_type.name.lower()>.dict file per type; missing files
+        # just mean no dictionary for that type.
+        self._zc_by_type: Dict[MessageType, Any] = {}
+        self._zd_by_type: Dict[MessageType, Any] = {}
+        if dict_dir and self.backend == 'zstd':
+            self._load_dictionaries(dict_dir)
+        if self._zc_by_type:
+            self.min_compress_size = min(self.min_compress_size, 32)
+        
+        # Binary payload codecs skip JSON's string escaping and number
+        # formatting; each packet records its codec in the header, so
+        # mixed-codec peers still decode each other. Falls back to JSON
+        # when the requested codec's package is missing.
+        if payload_codec == 'msgpack' and msgpack is not None:
+            self._payload_codec = _PAYLOAD_MSGPACK
+            self._payload_dumps = msgpack.packb
+        elif payload_codec == 'cbor' and cbor2 is not None:
+            self._payload_codec = _PAYLOAD_CBOR
+            self._payload_dumps = cbor2.dumps
+        else:
+            self._payload_codec = _PAYLOAD_JSON
+            self._payload_dumps = _dumps
+        
+        # Pre-serialized constant envelope prefixes per message type,
+        # registered via register_envelope
+        self._envelopes: Dict[MessageType, bytes] = {}
+        
+        # Compression level per message type as a flat bytearray
+        # indexed by MessageType.value - the per-message lookup is a
+        # plain array read instead of an enum hash and dict probe.
+        # Unassigned slots default to BALANCED.
+        self._levels = bytearray([CompressionLevel.BALANCED.value] * 8)
+        self._levels[MessageType.AUDIO_DATA.value] = CompressionLevel.FAST.value
+        self._levels[MessageType.STATUS_UPDATE.value] = CompressionLevel.FAST.value
+        self._levels[MessageType.ERROR_MESSAGE.value] = CompressionLevel.NONE.value
+        self._levels[MessageType.HEARTBEAT.value] = CompressionLevel.NONE.value
+        self._levels[MessageType.BATCH_UPDATE.value] = CompressionLevel.BEST.value
+        
+        # Statistics; timing can be switched off entirely, leaving
+        # only the byte/message counters the adaptive logic needs
+        self._stats_enabled = stats_enabled
         self.stats = CompressionStats()
-        self._recent_ratios: List[float] = []
+        # bounded deque plus a running sum: recording a ratio and
+        # averaging the window are both O(1), where the old list paid
+        # an O(n) pop(0) per message and an O(n) sum per adjustment
+        self._recent_ratios: deque = deque(maxlen=performance_window)
+        self._ratio_sum = 0.0
         
         # Adaptive settings
         self._auto_adjust = True
         self._last_adjustment = time.time()
         self._adjustment_interval = 30.0  # 30 seconds
         
+    def _load_dictionaries(self, dict_dir: str):
+        """Load per-message-type compression dictionaries from dict_dir."""
+        for message_type in MessageType:
+            path = os.path.join(dict_dir, f'{message_type.name.lower()}.dict')
+            if not os.path.isfile(path):
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    zstd_dict = zstandard.ZstdCompressionDict(f.read())
+                level = _ZSTD_LEVELS[CompressionLevel.BALANCED.value]
+                self._zc_by_type[message_type] = zstandard.ZstdCompressor(
+                    level=level, dict_data=zstd_dict, threads=0)
+                self._zd_by_type[message_type] = zstandard.ZstdDecompressor(
+                    dict_data=zstd_dict)
+            except Exception as e:
+                logger.warning(f"Failed to load compression dictionary {path}: {e}")
+
+    def register_envelope(self, message_type: MessageType, constant_prefix_bytes: bytes):
+        """
+        Register the pre-serialized constant part of a message envelope.
+
+        Status and transcription messages repeat a large constant
+        envelope ({"type":"status","session":"abc",...) on every send;
+        registering it once lets compress_delta serialize only the
+        fields that actually change.
+
+        Args:
+            message_type: Type the envelope applies to
+            constant_prefix_bytes: JSON fragment opening the object and
+                ending with a comma, e.g. b'{"type":"status","session":"abc",'
+        """
+        if not (constant_prefix_bytes.startswith(b'{') and constant_prefix_bytes.endswith(b',')):
+            raise ValueError("envelope prefix must start with '{' and end with ','")
+        self._envelopes[message_type] = constant_prefix_bytes
+
+    def compress_delta(self,
+                       delta: Dict[str, Any],
+                       message_type: MessageType,
+                       out: Optional[bytearray] = None) -> Union[bytes, memoryview]:
+        """
+        Compress a message whose envelope was registered for its type.
+
+        Only the changing fields in delta are serialized; the constant
+        envelope prefix is spliced in pre-encoded.
+        """
+        prefix = self._envelopes[message_type]
+        if delta:
+            # strip the leading '{' so the delta continues the envelope
+            payload = prefix + _dumps(delta)[1:]
+        else:
+            payload = prefix[:-1] + b'}'
+        return self.compress_bytes(payload, message_type, out=out)
+
     def compress_message(self, 
                         message: Dict[str, Any], 
                         message_type: MessageType = MessageType.TRANSCRIPTION_RESULT) -> bytes:
@@ -108,11 +289,27 @@ class AdaptiveCompressor:
         Returns:
             Compressed message bytes
         """
-        start_time = time.time()
-        
-        # Serialize message
-        json_data = json.dumps(message, ensure_ascii=False, separators=(',', ':'))
-        original_bytes = json_data.encode('utf-8')
+        return self.compress_bytes(self._payload_dumps(message), message_type,
+                                   payload_codec=self._payload_codec)
+
+    def compress_bytes(self,
+                       original_bytes: bytes,
+                       message_type: MessageType = MessageType.TRANSCRIPTION_RESULT,
+                       out: Optional[bytearray] = None,
+                       payload_codec: int = _PAYLOAD_JSON) -> Union[bytes, memoryview]:
+        """
+        Compress an already-serialized message payload.
+
+        Callers that need the serialized form anyway (e.g. to count
+        bytes sent) should serialize once and pass the bytes here
+        instead of going through compress_message.
+
+        When out= is given the packet is assembled into that buffer and
+        a memoryview of it is returned instead of a fresh bytes object;
+        the view is only valid until the next call reusing the buffer.
+        """
+        start_time = time.monotonic_ns() if self._stats_enabled else 0
+
         original_size = len(original_bytes)
         
         self.stats.total_messages += 1
@@ -121,40 +318,58 @@ class AdaptiveCompressor:
         # Check if compression is beneficial
         if original_size < self.min_compress_size:
             # Create uncompressed packet
-            packet = self._create_packet(MessageType.TRANSCRIPTION_RESULT, original_bytes, compressed=False)
+            packet = self._create_packet(message_type, original_bytes, compressed=False, out=out,
+                                         payload_codec=payload_codec)
             return packet
         
         # Get compression level for message type
-        compression_level = self._compression_levels.get(message_type, CompressionLevel.BALANCED)
+        level = self._levels[message_type.value]
         
-        if compression_level == CompressionLevel.NONE:
-            packet = self._create_packet(message_type, original_bytes, compressed=False)
+        if level == 0:
+            packet = self._create_packet(message_type, original_bytes, compressed=False, out=out,
+                                         payload_codec=payload_codec)
             return packet
         
         # Compress data
         try:
-            compressed_data = zlib.compress(original_bytes, compression_level.value)
+            dicted = False
+            if self.backend == 'zstd':
+                codec = _CODEC_ZSTD
+                dict_compressor = self._zc_by_type.get(message_type)
+                if dict_compressor is not None:
+                    compressed_data = dict_compressor.compress(original_bytes)
+                    dicted = True
+                else:
+                    compressed_data = self._zstd_compressors[level].compress(original_bytes)
+            else:
+                codec = _CODEC_ZLIB
+                compressed_data = zlib.compress(original_bytes, level)
             compressed_size = len(compressed_data)
             
             # Check compression effectiveness
             compression_ratio = compressed_size / original_size
             if compression_ratio > self.compression_threshold_ratio:
                 # Compression not effective, send uncompressed
-                packet = self._create_packet(message_type, original_bytes, compressed=False)
+                packet = self._create_packet(message_type, original_bytes, compressed=False, out=out,
+                                         payload_codec=payload_codec)
                 return packet
             
             # Create compressed packet
-            packet = self._create_packet(message_type, compressed_data, compressed=True)
+            packet = self._create_packet(message_type, compressed_data, compressed=True,
+                                         codec=codec, dicted=dicted, out=out,
+                                         payload_codec=payload_codec)
             
             # Update statistics
             self.stats.compressed_messages += 1
             self.stats.compressed_bytes += len(packet)
-            self.stats.compression_time_ms += (time.time() - start_time) * 1000
+            if self._stats_enabled:
+                self.stats.compression_time_ns += time.monotonic_ns() - start_time
             
             # Track compression ratios for adaptive adjustment
+            if len(self._recent_ratios) == self.performance_window:
+                self._ratio_sum -= self._recent_ratios[0]
             self._recent_ratios.append(compression_ratio)
-            if len(self._recent_ratios) > self.performance_window:
-                self._recent_ratios.pop(0)
+            self._ratio_sum += compression_ratio
             
             # Adaptive adjustment
             if self._auto_adjust:
@@ -165,7 +380,8 @@ class AdaptiveCompressor:
         except Exception as e:
             logger.error(f"Compression failed: {e}")
             # Fall back to uncompressed
-            packet = self._create_packet(message_type, original_bytes, compressed=False)
+            packet = self._create_packet(message_type, original_bytes, compressed=False, out=out,
+                                         payload_codec=payload_codec)
             return packet
     
     def decompress_message(self, packet: bytes) -> Dict[str, Any]:
@@ -178,22 +394,37 @@ class AdaptiveCompressor:
         Returns:
             Decompressed message dictionary
         """
-        start_time = time.time()
+        start_time = time.monotonic_ns() if self._stats_enabled else 0
         
         try:
             # Parse packet header
-            message_type, is_compressed, data = self._parse_packet(packet)
-            
+            message_type, is_compressed, codec, dicted, payload_codec, data = self._parse_packet(packet)
+
             if is_compressed:
-                # Decompress data
-                decompressed_data = zlib.decompress(data)
-                self.stats.decompression_time_ms += (time.time() - start_time) * 1000
+                # Decompress with the codec recorded in the header
+                if codec == _CODEC_ZSTD:
+                    if dicted:
+                        decompressor = self._zd_by_type.get(message_type)
+                        if decompressor is None:
+                            raise ValueError(
+                                f"No compression dictionary loaded for {message_type.name}")
+                    else:
+                        decompressor = self._zstd_decompressor
+                        if decompressor is None:
+                            raise ValueError("zstd packet received but zstandard is not installed")
+                    decompressed_data = decompressor.decompress(data)
+                else:
+                    decompressed_data = zlib.decompress(data)
+                if self._stats_enabled:
+                    self.stats.decompression_time_ns += time.monotonic_ns() - start_time
             else:
                 decompressed_data = data
             
-            # Deserialize JSON
-            json_str = decompressed_data.decode('utf-8')
-            message = json.loads(json_str)
+            # Batch packets carry a length-prefixed binary frame; all
+            # other packets carry one serialized message
+            if message_type == MessageType.BATCH_UPDATE:
+                return self._decode_batch_frame(decompressed_data)
+            message = self._decode_payload(decompressed_data, payload_codec)
             
             return message
             
@@ -201,31 +432,82 @@ class AdaptiveCompressor:
             logger.error(f"Decompression failed: {e}")
             raise
     
-    def _create_packet(self, 
-                      message_type: MessageType, 
-                      data: bytes, 
-                      compressed: bool) -> bytes:
+    @staticmethod
+    def _decode_payload(data: bytes, payload_codec: int) -> Any:
+        """Deserialize a payload using the codec named in its packet."""
+        if payload_codec == _PAYLOAD_MSGPACK:
+            if msgpack is None:
+                raise ValueError("msgpack packet received but msgpack is not installed")
+            return msgpack.unpackb(data, raw=False)
+        if payload_codec == _PAYLOAD_CBOR:
+            if cbor2 is None:
+                raise ValueError("cbor packet received but cbor2 is not installed")
+            return cbor2.loads(data)
+        return _loads(data)
+
+    def _decode_batch_frame(self, frame: bytes) -> Dict[str, Any]:
+        """Rebuild a batch message dict from a binary batch frame."""
+        count, timestamp = _BATCH_HDR.unpack_from(frame, 0)
+        offset = _BATCH_HDR.size
+        messages = []
+        for _ in range(count):
+            (length,) = _BATCH_LEN.unpack_from(frame, offset)
+            offset += _BATCH_LEN.size
+            messages.append(_loads(frame[offset:offset + length]))
+            offset += length
+        return {
+            'type': 'batch',
+            'messages': messages,
+            'count': count,
+            'timestamp': timestamp
+        }
+    
+    def _create_packet(self,
+                      message_type: MessageType,
+                      data: bytes,
+                      compressed: bool,
+                      codec: int = _CODEC_NONE,
+                      dicted: bool = False,
+                      out: Optional[bytearray] = None,
+                      payload_codec: int = _PAYLOAD_JSON) -> Union[bytes, memoryview]:
         """
         Create a message packet with header.
-        
+
         Packet format:
         - 1 byte: Message type
-        - 1 byte: Flags (bit 0: compressed)
+        - 1 byte: Flags (bit 0: compressed, bits 1-2: codec id,
+          bit 3: compressed with a per-type dictionary,
+          bits 4-5: payload codec id)
         - 4 bytes: Data length (big-endian)
         - N bytes: Data
         """
-        header = struct.pack('>BB I', 
-                           message_type.value,
-                           1 if compressed else 0,
-                           len(data))
+        flags = ((1 if compressed else 0) | (codec << 1) | (8 if dicted else 0)
+                 | (payload_codec << 4))
+        if out is not None:
+            return self._create_packet_into(out, message_type, flags, data)
+        header = _HDR.pack(message_type.value, flags, len(data))
         return header + data
+
+    @staticmethod
+    def _create_packet_into(buf: bytearray,
+                            message_type: MessageType,
+                            flags: int,
+                            data: bytes) -> memoryview:
+        """Assemble a packet into a reusable buffer, growing it when the
+        payload is larger, and return a view of the packet bytes."""
+        total = _HDR.size + len(data)
+        if len(buf) < total:
+            buf.extend(bytes(total - len(buf)))
+        _HDR.pack_into(buf, 0, message_type.value, flags, len(data))
+        buf[_HDR.size:total] = data
+        return memoryview(buf)[:total]
     
-    def _parse_packet(self, packet: bytes) -> tuple[MessageType, bool, bytes]:
+    def _parse_packet(self, packet: bytes) -> tuple[MessageType, bool, int, bool, int, bytes]:
         """Parse a message packet."""
-        if len(packet) < 6:
+        if len(packet) < _HDR.size:
             raise ValueError("Invalid packet: too short")
         
-        msg_type_value, flags, data_length = struct.unpack('>BB I', packet[:6])
+        msg_type_value, flags, data_length = _HDR.unpack_from(packet)
         
         try:
             message_type = MessageType(msg_type_value)
@@ -233,12 +515,15 @@ class AdaptiveCompressor:
             message_type = MessageType.TRANSCRIPTION_RESULT
         
         is_compressed = bool(flags & 1)
-        data = packet[6:6+data_length]
+        codec = (flags >> 1) & 3
+        dicted = bool(flags & 8)
+        payload_codec = (flags >> 4) & 3
+        data = packet[_HDR.size:_HDR.size + data_length]
         
         if len(data) != data_length:
             raise ValueError(f"Invalid packet: expected {data_length} bytes, got {len(data)}")
         
-        return message_type, is_compressed, data
+        return message_type, is_compressed, codec, dicted, payload_codec, data
     
     def _maybe_adjust_compression(self):
         """Automatically adjust compression levels based on performance."""
@@ -249,7 +534,7 @@ class AdaptiveCompressor:
         if len(self._recent_ratios) < 10:
             return
         
-        avg_ratio = sum(self._recent_ratios) / len(self._recent_ratios)
+        avg_ratio = self._ratio_sum / len(self._recent_ratios)
         
         # If compression ratio is poor, reduce compression level
         if avg_ratio > 0.9:
@@ -263,21 +548,21 @@ class AdaptiveCompressor:
     
     def _reduce_compression_levels(self):
         """Reduce compression levels for better performance."""
-        for msg_type in self._compression_levels:
-            current = self._compression_levels[msg_type]
-            if current == CompressionLevel.BEST:
-                self._compression_levels[msg_type] = CompressionLevel.BALANCED
-            elif current == CompressionLevel.BALANCED:
-                self._compression_levels[msg_type] = CompressionLevel.FAST
+        levels = self._levels
+        for i, current in enumerate(levels):
+            if current == CompressionLevel.BEST.value:
+                levels[i] = CompressionLevel.BALANCED.value
+            elif current == CompressionLevel.BALANCED.value:
+                levels[i] = CompressionLevel.FAST.value
     
     def _increase_compression_levels(self):
         """Increase compression levels for better compression."""
-        for msg_type in self._compression_levels:
-            current = self._compression_levels[msg_type]
-            if current == CompressionLevel.FAST:
-                self._compression_levels[msg_type] = CompressionLevel.BALANCED
-            elif current == CompressionLevel.BALANCED:
-                self._compression_levels[msg_type] = CompressionLevel.BEST
+        levels = self._levels
+        for i, current in enumerate(levels):
+            if current == CompressionLevel.FAST.value:
+                levels[i] = CompressionLevel.BALANCED.value
+            elif current == CompressionLevel.BALANCED.value:
+                levels[i] = CompressionLevel.BEST.value
     
     def get_stats(self) -> Dict[str, Any]:
         """Get compression statistics."""
@@ -291,7 +576,8 @@ class AdaptiveCompressor:
             'space_saved_percent': self.stats.space_saved_percent,
             'avg_compression_time_ms': self.stats.compression_time_ms / max(1, self.stats.compressed_messages),
             'avg_decompression_time_ms': self.stats.decompression_time_ms / max(1, self.stats.compressed_messages),
-            'compression_levels': {mt.name: cl.name for mt, cl in self._compression_levels.items()}
+            'compression_levels': {mt.name: CompressionLevel(self._levels[mt.value]).name
+                                   for mt in MessageType}
         }
 
 class MessageBatcher:
@@ -313,50 +599,56 @@ class MessageBatcher:
         self.max_batch_bytes = max_batch_bytes
         self.batch_timeout_ms = batch_timeout_ms / 1000  # Convert to seconds
         
-        self._batch_queue: List[Dict[str, Any]] = []
+        self._batch_queue: List[tuple] = []  # (message, raw bytes or None)
         self._batch_size_bytes = 0
         self._batch_timer: Optional[asyncio.TimerHandle] = None
-        self._batch_lock = asyncio.Lock()
         self._flush_callback: Optional[Callable] = None
         
     def set_flush_callback(self, callback: Callable):
         """Set callback function for when batch is ready to send."""
         self._flush_callback = callback
     
-    async def add_message(self, message: Dict[str, Any]) -> bool:
+    async def add_message(self, message: Dict[str, Any], raw: Optional[bytes] = None) -> bool:
         """
         Add message to batch.
         
         Args:
             message: Message to add to batch
+            raw: Optional pre-serialized form of the message; avoids a
+                second serialization pass just to measure its size
             
         Returns:
             True if message was added, False if batch is full
         """
-        async with self._batch_lock:
-            # Estimate message size
-            msg_size = len(json.dumps(message, separators=(',', ':')))
-            
-            # Check if adding this message would exceed limits
-            if (len(self._batch_queue) >= self.max_batch_size or
-                self._batch_size_bytes + msg_size > self.max_batch_bytes):
-                # Flush current batch first
-                await self._flush_batch()
-            
-            # Add message to batch
-            self._batch_queue.append(message)
-            self._batch_size_bytes += msg_size
-            
-            # Set timer for automatic flush if this is the first message
-            if len(self._batch_queue) == 1:
-                self._set_batch_timer()
-            
-            return True
+        # All queue mutations happen on the event loop with no await in
+        # between, so they are already atomic; a lock here only added an
+        # acquire/release round-trip per message. _flush_batch detaches
+        # the queue before its first await, so a flush racing with the
+        # timer task sees an empty queue and returns.
+        
+        # Exact size when the caller already serialized; otherwise a
+        # cheap repr-based estimate is close enough for batch sizing
+        msg_size = len(raw) if raw is not None else len(repr(message))
+        
+        # Check if adding this message would exceed limits
+        if (len(self._batch_queue) >= self.max_batch_size or
+            self._batch_size_bytes + msg_size > self.max_batch_bytes):
+            # Flush current batch first
+            await self._flush_batch()
+        
+        # Add message to batch
+        self._batch_queue.append((message, raw))
+        self._batch_size_bytes += msg_size
+        
+        # Set timer for automatic flush if this is the first message
+        if len(self._batch_queue) == 1:
+            self._set_batch_timer()
+        
+        return True
     
     async def flush_now(self):
         """Force immediate flush of current batch."""
-        async with self._batch_lock:
-            await self._flush_batch()
+        await self._flush_batch()
     
     async def _flush_batch(self):
         """Internal batch flush."""
@@ -368,22 +660,38 @@ class MessageBatcher:
             self._batch_timer.cancel()
             self._batch_timer = None
         
-        # Create batch message
+        # Detach the queue by rebinding instead of copying and
+        # clearing; the flushed batch keeps the old list and new
+        # messages append to a fresh one
+        queue = self._batch_queue
+        self._batch_queue = []
+        self._batch_size_bytes = 0
+        
+        # Create batch message and concatenate the already-serialized
+        # payloads with length prefixes instead of re-serializing the
+        # batch as one large JSON document; the whole frame is
+        # compressed in one shot.
+        timestamp = time.time()
+        messages = []
+        parts = [_BATCH_HDR.pack(len(queue), timestamp)]
+        for message, raw in queue:
+            messages.append(message)
+            if raw is None:
+                raw = _dumps(message)
+            parts.append(_BATCH_LEN.pack(len(raw)))
+            parts.append(raw)
+        frame = b''.join(parts)
         batch_message = {
             'type': 'batch',
-            'messages': self._batch_queue.copy(),
-            'count': len(self._batch_queue),
-            'timestamp': time.time()
+            'messages': messages,
+            'count': len(queue),
+            'timestamp': timestamp
         }
         
-        # Clear batch
-        self._batch_queue.clear()
-        self._batch_size_bytes = 0
-        
         # Send via callback
         if self._flush_callback:
             try:
-                await self._flush_callback(batch_message)
+                await self._flush_callback(batch_message, MessageType.BATCH_UPDATE, frame)
             except Exception as e:
                 logger.error(f"Batch flush callback failed: {e}")
     
@@ -421,6 +729,26 @@ class OptimizedWebSocketHandler:
         if self.batcher:
             self.batcher.set_flush_callback(self._send_compressed_message)
         
+        # Heartbeats never change, so the wire form is built once here
+        # and each send skips serialization and the compressor entirely.
+        # Error payloads carry varying text and cannot be pre-built;
+        # they already bypass compression via their NONE level.
+        # Reusable packet buffer: every outgoing packet is assembled
+        # in the same bytearray instead of allocating header+payload
+        # each time. The batcher's timer flushes in their own tasks, so
+        # sends are NOT naturally sequential; the lock below keeps a
+        # packet view alive until its send has finished consuming it.
+        self._send_buf = bytearray(65536)
+        self._send_lock = asyncio.Lock()
+        
+        self._heartbeat_message = {'type': 'heartbeat'}
+        self._heartbeat_raw = _dumps(self._heartbeat_message)
+        if self.compressor:
+            self._heartbeat_packet = self.compressor._create_packet(
+                MessageType.HEARTBEAT, self._heartbeat_raw, compressed=False)
+        else:
+            self._heartbeat_packet = None
+        
         # Statistics
         self._messages_sent = 0
         self._bytes_sent = 0
@@ -439,26 +767,48 @@ class OptimizedWebSocketHandler:
         """
         # For critical messages or when batching is disabled, send immediately
         if force_immediate or not self.enable_batching or message_type in [MessageType.ERROR_MESSAGE, MessageType.HEARTBEAT]:
+            if message_type == MessageType.HEARTBEAT and message == self._heartbeat_message:
+                await self.send_heartbeat()
+                return
             await self._send_compressed_message(message, message_type)
         else:
-            # Add to batch
-            await self.batcher.add_message(message)
+            # Add to batch; the serialized form sizes the batch now and
+            # feeds the binary batch frame when it is flushed
+            await self.batcher.add_message(message, _dumps(message))
+    
+    async def send_heartbeat(self):
+        """Send the pre-built heartbeat, bypassing the send pipeline."""
+        if self._heartbeat_packet is not None:
+            await self.websocket.send_bytes(self._heartbeat_packet)
+        else:
+            await self.websocket.send_text(self._heartbeat_raw.decode('utf-8'))
+        self._messages_sent += 1
+        self._bytes_sent += len(self._heartbeat_raw)
     
     async def _send_compressed_message(self, message: Dict[str, Any], 
-                                     message_type: MessageType = MessageType.TRANSCRIPTION_RESULT):
+                                     message_type: MessageType = MessageType.TRANSCRIPTION_RESULT,
+                                     raw: Optional[bytes] = None):
         """Send a message with optional compression."""
         try:
+            # Serialize once; the same bytes feed the compressor, the
+            # uncompressed send path and the bytes-sent counter. Batch
+            # flushes hand over their binary frame directly.
+            if raw is None:
+                raw = _dumps(message)
             if self.enable_compression and self.compressor:
-                # Compress message
-                packet = self.compressor.compress_message(message, message_type)
-                await self.websocket.send_bytes(packet)
+                # The shared buffer must not be rewritten while a prior
+                # send still holds a view into it
+                async with self._send_lock:
+                    packet = self.compressor.compress_bytes(raw, message_type, out=self._send_buf)
+                    await self.websocket.send_bytes(packet)
             else:
-                # Send as JSON
-                json_data = json.dumps(message, ensure_ascii=False)
-                await self.websocket.send_text(json_data)
+                # Text transport cannot carry the binary batch frame
+                if message_type == MessageType.BATCH_UPDATE:
+                    raw = _dumps(message)
+                await self.websocket.send_text(raw.decode('utf-8'))
             
             self._messages_sent += 1
-            self._bytes_sent += len(json.dumps(message, separators=(',', ':')))
+            self._bytes_sent += len(raw)
             
         except Exception as e:
             logger.error(f"Failed to send WebSocket message: {e}")
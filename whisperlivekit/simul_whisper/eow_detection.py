@@ -41,6 +41,11 @@ def load_cif(cfg, n_audio_state, device):
                 always_fire = False
                 
     cif_linear.to(device)
+    # The projection only feeds a sigmoid, so half precision is plenty
+    # and halves the weight/activation traffic. CUDA only - fp16 matmul
+    # is slow on CPU.
+    if torch.device(device).type == 'cuda':
+        cif_linear.half()
     return cif_linear, always_fire, never_fire
 
 
@@ -53,26 +58,25 @@ def resize(alphas, target_lengths, threshold=0.999):
     # sum
     _num = alphas.sum(-1)
     num = target_lengths.float()
-    # scaling
-    _alphas = alphas * (num / _num)[:, None].repeat(1, alphas.size(1))
-    # rm attention value that exceeds threashold
-    count = 0
-    while len(torch.where(_alphas > threshold)[0]):
-        count += 1
-        if count > 10:
+    # scaling (broadcast instead of materializing a repeated column)
+    _alphas = alphas * (num / _num)[:, None]
+    # rm attention value that exceeds threashold: smooth every offending
+    # row at once instead of looping over (x, y) index pairs in python,
+    # which forced a host round-trip per element
+    for _ in range(10):
+        over = (_alphas > threshold).any(dim=-1)
+        if not over.any():
             break
-        xs, ys = torch.where(_alphas > threshold)
-        for x, y in zip(xs, ys):
-            if _alphas[x][y] >= threshold:
-                mask = _alphas[x].ne(0).float()
-                mean = 0.5 * _alphas[x].sum() / mask.sum()
-                _alphas[x] = _alphas[x] * 0.5 + mean * mask
+        mask = _alphas.ne(0).float()
+        mean = 0.5 * _alphas.sum(-1, keepdim=True) / mask.sum(-1, keepdim=True).clamp(min=1.0)
+        _alphas = torch.where(over[:, None], _alphas * 0.5 + mean * mask, _alphas)
 
     return _alphas, _num
  
-def fire_at_boundary(chunked_encoder_feature: torch.Tensor, cif_linear):
-    content_mel_len = chunked_encoder_feature.shape[1] # B, T, D
-    alphas = cif_linear(chunked_encoder_feature).squeeze(dim=2) # B, T
+def _fire_at_boundary_impl(chunked_encoder_feature, weight, bias, content_mel_len):
+    """Tensor-only core of fire_at_boundary, taking the CIF projection
+    weights directly so the whole computation is compilable."""
+    alphas = torch.nn.functional.linear(chunked_encoder_feature, weight, bias).squeeze(dim=2) # B, T
     alphas = torch.sigmoid(alphas)
     decode_length = torch.round(alphas.sum(-1)).int()
     alphas, _ = resize(alphas, decode_length)
@@ -81,8 +85,42 @@ def fire_at_boundary(chunked_encoder_feature: torch.Tensor, cif_linear):
     integrate = torch.cumsum(alphas[:-1], dim=0) # ignore the peak value at the end of the content chunk
     exceed_count = integrate[-1] // threshold
     integrate = integrate - exceed_count*1.0 # minus 1 every time intergrate exceed the threshold
-    important_positions = (integrate >= 0).nonzero(as_tuple=True)[0]
-    if important_positions.numel() == 0:
-        return False
-    else:
-        return important_positions[0] >= content_mel_len-2
\ No newline at end of file
+    # find the first boundary position on-device; argmax over the bool
+    # mask avoids the host sync that nonzero() forces
+    boundary = integrate >= 0
+    first_position = torch.argmax(boundary.to(torch.int8))
+    return boundary.any() & (first_position >= content_mel_len - 2)
+
+
+# The boundary check runs once per streamed chunk on small tensors, so
+# python dispatch overhead dominates; compile the core when available.
+# dynamic=True because the mel length differs between chunks.
+# torch.compile itself is lazy and only fails on the first real call
+# (e.g. no C++ toolchain or triton for the inductor backend), so the
+# eager function is kept around and restored on that first failure.
+_fire_at_boundary_eager = _fire_at_boundary_impl
+if hasattr(torch, 'compile'):
+    try:
+        _fire_at_boundary_impl = torch.compile(
+            _fire_at_boundary_impl, mode='reduce-overhead', dynamic=True)
+    except Exception as e:
+        logger.debug(f"torch.compile unavailable for CIF boundary check: {e}")
+
+
+def fire_at_boundary(chunked_encoder_feature: torch.Tensor, cif_linear):
+    global _fire_at_boundary_impl
+    content_mel_len = chunked_encoder_feature.shape[1] # B, T, D
+    # no-op unless the projection was converted to half precision
+    chunked_encoder_feature = chunked_encoder_feature.to(cif_linear.weight.dtype)
+    try:
+        fired = _fire_at_boundary_impl(
+            chunked_encoder_feature, cif_linear.weight, cif_linear.bias, content_mel_len)
+    except Exception as e:
+        if _fire_at_boundary_impl is _fire_at_boundary_eager:
+            raise
+        logger.warning(f"Compiled CIF boundary check failed ({e}); falling back to eager mode")
+        _fire_at_boundary_impl = _fire_at_boundary_eager
+        fired = _fire_at_boundary_impl(
+            chunked_encoder_feature, cif_linear.weight, cif_linear.bias, content_mel_len)
+    # the only host synchronization in the whole check
+    return bool(fired.item())
\ No newline at end of file
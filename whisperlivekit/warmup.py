@@ -1,12 +1,91 @@
 
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+_JFK_URL = "https://github.com/ggerganov/whisper.cpp/raw/master/samples/jfk.wav"
+# sha256 to pin the JFK sample download against; None skips the check
+_JFK_SHA256 = None
+
+
+def _download_file(url, dest, timeout=5, expected_sha256=None, retries=1):
+    """Download url to dest atomically, verifying the sha256 when one is
+    given. Retries once before giving up; returns True on success."""
+    import hashlib
+    import os
+    import urllib.request
+
+    for attempt in range(retries + 1):
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                data = response.read()
+            if expected_sha256 is not None:
+                digest = hashlib.sha256(data).hexdigest()
+                if digest != expected_sha256:
+                    raise ValueError(f"checksum mismatch: got {digest}")
+            # write-then-rename so a failed download never leaves a
+            # truncated file that later runs would trust
+            tmp_path = f"{dest}.part"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, dest)
+            return True
+        except Exception as e:
+            if attempt < retries:
+                logger.warning(f"Download of {url} failed ({e}), retrying once")
+            else:
+                logger.warning(f"Download of {url} failed after retry: {e}. Proceeding without warmup.")
+    return False
+
+
+async def load_file_async(warmup_file=None, timeout=5):
+    """load_file for async callers; the blocking download and decode run
+    in a worker thread so the event loop stays responsive."""
+    import asyncio
+    return await asyncio.to_thread(load_file, warmup_file, timeout)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_audio_cached(path, sr=16000):
+    """Decode an audio file, caching the result in memory and as a .npy
+    sidecar so repeated warmups skip the decode entirely."""
+    import math
+    import os
+    import numpy as np
+
+    sidecar = f"{path}.{sr}.npy"
+    try:
+        if os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(path):
+            # memory-mapped, so reuse across processes costs no RSS
+            return np.load(sidecar, mmap_mode='r')
+    except Exception as e:
+        logger.debug(f"Ignoring stale warmup sidecar {sidecar}: {e}")
+    # soundfile decodes straight to float32 and resample_poly is a
+    # polyphase FIR - together an order of magnitude cheaper than
+    # librosa.load, which routes through its full resampling stack
+    try:
+        import soundfile as sf
+        from scipy.signal import resample_poly
+        data, in_sr = sf.read(path, dtype='float32', always_2d=True)
+        audio = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+        if in_sr != sr:
+            g = math.gcd(in_sr, sr)
+            audio = resample_poly(audio, sr // g, in_sr // g).astype(np.float32)
+    except Exception as e:
+        logger.debug(f"soundfile decode failed for {path}, falling back to librosa: {e}")
+        import librosa
+        audio, _ = librosa.load(path, sr=sr)
+    try:
+        np.save(sidecar, audio)
+    except OSError as e:
+        logger.debug(f"Could not write warmup sidecar {sidecar}: {e}")
+    return audio
+
+
 def load_file(warmup_file=None, timeout=5):
     import os
     import tempfile
-    import librosa
     
     # If warmup_file is explicitly set to False or "false", skip warmup
     if warmup_file is False or warmup_file == "false":
@@ -34,7 +113,7 @@ def load_file(warmup_file=None, timeout=5):
         
         if os.path.exists(warmup_file) and os.path.getsize(warmup_file) > 0:
             try:
-                audio, sr = librosa.load(warmup_file, sr=16000)
+                audio = _load_audio_cached(warmup_file)
                 logger.info(f"Loaded warmup file: {warmup_file}")
                 return audio
             except Exception as e:
@@ -44,30 +123,15 @@ def load_file(warmup_file=None, timeout=5):
         
     if warmup_file is None:
         # Download JFK sample if not already present
-        jfk_url = "https://github.com/ggerganov/whisper.cpp/raw/master/samples/jfk.wav"
         temp_dir = tempfile.gettempdir()
         warmup_file = os.path.join(temp_dir, "whisper_warmup_jfk.wav")
         
         if not os.path.exists(warmup_file):
-            logger.debug(f"Downloading warmup file from {jfk_url}")
-            print(f"Downloading warmup file from {jfk_url}")
-            import time
-            import urllib.request
-            import urllib.error
-            import socket
-            
-            original_timeout = socket.getdefaulttimeout()
-            socket.setdefaulttimeout(timeout)
-            
-            start_time = time.time()
-            try:
-                urllib.request.urlretrieve(jfk_url, warmup_file)
-                logger.debug(f"Download successful in {time.time() - start_time:.2f}s")
-            except (urllib.error.URLError, socket.timeout) as e:
-                logger.warning(f"Download failed: {e}. Proceeding without warmup.")
+            logger.debug(f"Downloading warmup file from {_JFK_URL}")
+            print(f"Downloading warmup file from {_JFK_URL}")
+            if not _download_file(_JFK_URL, warmup_file, timeout=timeout,
+                                  expected_sha256=_JFK_SHA256):
                 return None
-            finally:
-                socket.setdefaulttimeout(original_timeout)
     elif not warmup_file:
         return None 
     
@@ -76,7 +140,7 @@ def load_file(warmup_file=None, timeout=5):
         return None
     
     try:
-        audio, sr = librosa.load(warmup_file, sr=16000)
+        audio = _load_audio_cached(warmup_file)
     except Exception as e:
         logger.warning(f"Failed to load audio file: {e}")
         return None